@@ -9,27 +9,654 @@ import sys
 import time
 import yaml
 import subprocess
-import json
+import hashlib
+import threading
+import asyncio
+import functools
+import io
+import shutil
+import string
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Dict, List
 from dataclasses import dataclass
 
 try:
-    from kubernetes import client, config
+    from kubernetes import client, config, watch
     from kubernetes.client.rest import ApiException
-    from rich.console import Console
+    from kubernetes.stream import stream as k8s_stream
+    import urllib3
+    from rich.console import Console, Group
     from rich.table import Table
     from rich.progress import Progress, SpinnerColumn, TextColumn
     from rich.panel import Panel
     from rich.prompt import Prompt, Confirm
+    from rich.text import Text
     from rich import print as rprint
     import docker
+    import ijson
+    import orjson
+    import requests
 except ImportError:
     print("ERROR: Required packages not installed. Please run: pip install -r requirements.txt")
     sys.exit(1)
 
 # Initialize Rich console
-console = Console()
+_BASE_CONSOLE = Console()
+_THREAD_CONSOLE = threading.local()
+
+
+class _ConsoleProxy:
+    """Route console calls to a per-thread console when one is installed.
+
+    Worker threads (e.g. parallel health checks) can record their output
+    into a private console and have it replayed in a stable order instead
+    of interleaving lines on the shared one. Threads without an override
+    fall through to the base console, so normal code is unaffected.
+    """
+
+    @staticmethod
+    def _target() -> Console:
+        return getattr(_THREAD_CONSOLE, 'console', _BASE_CONSOLE)
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+    # `with` statements (e.g. inside rich's Live/Progress) resolve the
+    # context-manager dunders on the type, bypassing __getattr__, so they
+    # have to delegate explicitly
+    def __enter__(self):
+        return self._target().__enter__()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return self._target().__exit__(exc_type, exc_val, exc_tb)
+
+
+console = _ConsoleProxy()
+
+
+def _run_with_buffered_console(fn):
+    """Run fn with its console output recorded; returns (result, buffer).
+
+    Used by parallel workers so their lines can be replayed in a stable
+    order on the shared console instead of interleaving.
+    """
+    buf = io.StringIO()
+    _THREAD_CONSOLE.console = Console(
+        file=buf, force_terminal=_BASE_CONSOLE.is_terminal, width=_BASE_CONSOLE.width
+    )
+    try:
+        return fn(), buf
+    finally:
+        del _THREAD_CONSOLE.console
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_env_file(path: str, mtime: float) -> tuple:
+    """Parse a .env file into (key, value) pairs, cached per (path, mtime)"""
+    pairs = []
+    for line in Path(path).read_text().splitlines():
+        line = line.strip()
+        if not line or line[0] == '#':
+            continue
+        key, sep, value = line.partition('=')
+        if sep:
+            pairs.append((key, value))
+    return tuple(pairs)
+
+
+class TTLCache:
+    """Per-endpoint TTL cache for repeated cluster-state queries"""
+
+    def __init__(self):
+        self._entries: Dict[str, tuple] = {}
+
+    def get_or_call(self, key: str, ttl: float, fn):
+        """Return the cached value for key if fresh, otherwise call fn and cache it.
+
+        Falls back to the stale entry if fn raises, so transient API errors
+        don't break back-to-back menu invocations.
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+        try:
+            value = fn()
+        except Exception:
+            if entry is not None:
+                return entry[1]
+            raise
+        self._entries[key] = (now, value)
+        return value
+
+    def invalidate(self, *keys: str):
+        """Drop cached entries (all of them when called with no keys)"""
+        if not keys:
+            self._entries.clear()
+            return
+        for key in keys:
+            self._entries.pop(key, None)
+
+
+# Shared cache for read endpoints hit repeatedly from the interactive menus
+_STATE_CACHE = TTLCache()
+
+
+def kube_context() -> str:
+    """Kube context for the cluster this process drives.
+
+    GRAFANA_MGR_CONTEXT names an arbitrary kubeconfig context explicitly;
+    otherwise the context is derived from GRAFANA_CLUSTER (a Kind cluster
+    name). Either way, multiple shells can drive independent clusters in
+    parallel (e.g. a CI matrix) without touching the current kubeconfig
+    context.
+    """
+    explicit = os.environ.get('GRAFANA_MGR_CONTEXT')
+    if explicit:
+        return explicit
+    return f"kind-{os.environ.get('GRAFANA_CLUSTER', 'grafana-cluster')}"
+
+
+def kubectl_base() -> List[str]:
+    """kubectl argv prefix pinned to the selected cluster context"""
+    return ["kubectl", "--context", kube_context()]
+
+
+# Shared Kubernetes API client; kube config is parsed once per process and the
+# underlying urllib3 connection pool is reused by every manager.
+_API_CLIENT = None
+
+
+def get_api_client() -> 'client.ApiClient':
+    """Load kube config once and return the shared ApiClient"""
+    global _API_CLIENT
+    if _API_CLIENT is None:
+        try:
+            config.load_kube_config(context=kube_context())
+        except Exception:
+            # Context may not exist yet (cluster not created); use the default
+            config.load_kube_config()
+        # Size the urllib3 pool for the parallel health checks and watcher
+        # threads so concurrent reads reuse warm TLS connections instead of
+        # opening and discarding extras beyond the default pool of one
+        configuration = client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = 8
+        # Transient API errors retry at the transport layer instead of the
+        # config-reload dance each manager used to do. Must be set before the
+        # ApiClient is built: the urllib3 PoolManager reads it at construction.
+        configuration.retries = urllib3.Retry(total=3, backoff_factor=0.2)
+        # async_req calls run on this pool; the default of one thread would
+        # serialize batched reads like verify_backup_resources
+        _API_CLIENT = client.ApiClient(configuration, pool_threads=4)
+    return _API_CLIENT
+
+
+def _run_streamed(cmd: List[str], check: bool = False,
+                  input: Optional[bytes] = None) -> subprocess.CompletedProcess:
+    """Run a command with output drained by a reader thread.
+
+    The main thread blocks directly in the process wait() while a side thread
+    reads the pipes, instead of subprocess.run's buffered poll loop, so short
+    calls complete as soon as the process exits.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE if input is not None else None,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    output = {}
+
+    def _drain():
+        output['stdout'] = proc.stdout.read()
+        output['stderr'] = proc.stderr.read()
+
+    reader = threading.Thread(target=_drain)
+    reader.start()
+    if input is not None:
+        proc.stdin.write(input)
+        proc.stdin.close()
+    returncode = proc.wait()
+    reader.join()
+
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(
+            returncode, cmd, output=output.get('stdout'), stderr=output.get('stderr')
+        )
+    return subprocess.CompletedProcess(cmd, returncode, output.get('stdout'), output.get('stderr'))
+
+
+# Fingerprints of manifests already applied, so re-runs during iterative
+# development skip the API round-trip for unchanged files. Keyed per cluster
+# context; bypass with the --force-apply flag.
+_APPLIED_CACHE_PATH = Path.home() / ".cache" / "grafana-manager" / "applied.json"
+_FORCE_APPLY = "--force-apply" in sys.argv
+
+
+def _load_applied_cache() -> Dict[str, str]:
+    try:
+        return orjson.loads(_APPLIED_CACHE_PATH.read_bytes())
+    except Exception:
+        return {}
+
+
+def _save_applied_cache(cache: Dict[str, str]):
+    try:
+        _APPLIED_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _APPLIED_CACHE_PATH.with_suffix(".tmp")
+        tmp.write_bytes(orjson.dumps(cache))
+        os.replace(tmp, _APPLIED_CACHE_PATH)
+    except Exception:
+        pass
+
+
+def _applied_cache_key(manifest_path: Path) -> str:
+    return f"{kube_context()}:{manifest_path}"
+
+
+def _drop_applied_cache_context():
+    """Forget applied-manifest digests recorded for the current context.
+
+    The context name survives a kind delete + recreate, so digests taken
+    against the old cluster would otherwise make apply_manifest skip every
+    unchanged manifest on the brand-new empty cluster. Called whenever the
+    cluster is deleted or created.
+    """
+    prefix = f"{kube_context()}:"
+    cache = _load_applied_cache()
+    pruned = {k: v for k, v in cache.items() if not k.startswith(prefix)}
+    if len(pruned) != len(cache):
+        _save_applied_cache(pruned)
+
+
+# Persistent API discovery cache shared by every kubectl subprocess; the 6h
+# TTL matches kubectl's own ~/.kube/cache expiry.
+_DISCOVERY_CACHE_DIR = _APPLIED_CACHE_PATH.parent / "discovery"
+_DISCOVERY_TTL_SECONDS = 21600
+
+
+def _init_discovery_cache():
+    """Point kubectl at an on-disk discovery cache so group/version data
+    survives across invocations instead of being re-fetched per process."""
+    try:
+        _DISCOVERY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Mark the cache dir so backup tools skip it
+        tag = _DISCOVERY_CACHE_DIR.parent / "CACHEDIR.TAG"
+        if not tag.exists():
+            tag.write_text("Signature: 8a477f597d28d172789f06886806bc55\n")
+        # Expire entries past the TTL so stale group/version data doesn't
+        # outlive an API-server upgrade
+        cutoff = time.time() - _DISCOVERY_TTL_SECONDS
+        for cached in _DISCOVERY_CACHE_DIR.rglob("*.json"):
+            if cached.stat().st_mtime < cutoff:
+                cached.unlink()
+    except OSError:
+        pass
+    os.environ.setdefault("KUBECACHEDIR", str(_DISCOVERY_CACHE_DIR))
+
+
+_init_discovery_cache()
+
+
+def prewarm_discovery_cache():
+    """Warm the kubectl discovery cache in the background at startup.
+
+    One detached `kubectl api-resources` fill means every later kubectl
+    invocation finds group/version data on disk instead of re-running
+    discovery against a cold cluster. Fire-and-forget: the menu must not
+    wait on it and a failure just leaves the cache cold.
+    """
+    try:
+        proc = subprocess.Popen(
+            [*kubectl_base(), "api-resources"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        atexit.register(proc.wait)
+    except OSError:
+        pass
+
+
+# Keep-alive session for any plain HTTP fetches (remote manifests, health probes)
+_HTTP_SESSION = requests.Session()
+
+
+def fetch_remote_manifest(url: str, cache_name: str) -> bytes:
+    """Fetch a remote manifest through the shared session with an ETag cache.
+
+    Subsequent runs send If-None-Match and reuse the on-disk copy on 304 (or
+    when the network is unavailable), skipping the body transfer entirely.
+    """
+    cache_path = _APPLIED_CACHE_PATH.parent / cache_name
+    etag_path = cache_path.with_suffix(cache_path.suffix + ".etag")
+
+    headers = {}
+    if cache_path.exists() and etag_path.exists():
+        headers["If-None-Match"] = etag_path.read_text().strip()
+
+    try:
+        resp = _HTTP_SESSION.get(url, headers=headers, timeout=10)
+    except requests.RequestException:
+        if cache_path.exists():
+            return cache_path.read_bytes()
+        raise
+
+    if resp.status_code == 304:
+        return cache_path.read_bytes()
+    resp.raise_for_status()
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(resp.content)
+        if resp.headers.get("ETag"):
+            etag_path.write_text(resp.headers["ETag"])
+    except OSError:
+        pass
+    return resp.content
+
+
+@functools.lru_cache(maxsize=None)
+def _read_manifest(path: str, mtime: float) -> bytes:
+    """Manifest bytes cached per (path, mtime); files don't change mid-run"""
+    return Path(path).read_bytes()
+
+
+def read_manifest(manifest_path: Path) -> bytes:
+    """Read a manifest through the mtime-keyed cache"""
+    return _read_manifest(str(manifest_path), manifest_path.stat().st_mtime)
+
+
+def apply_manifest(manifest_path: Path):
+    """Apply a Kubernetes manifest with server-side apply.
+
+    The cached manifest bytes are piped to kubectl apply --server-side so the
+    server performs the merge and the client skips its diff computation.
+    Unchanged manifests (same sha256 as the last successful apply) are skipped
+    entirely unless --force-apply was given.
+    """
+    body = read_manifest(manifest_path)
+    digest = hashlib.sha256(body).hexdigest()
+    cache = _load_applied_cache()
+    key = _applied_cache_key(manifest_path)
+    if not _FORCE_APPLY and cache.get(key) == digest:
+        return
+    _run_streamed(
+        [*kubectl_base(), "apply", "--server-side=true",
+         "--field-manager=grafana-manager", "-f", "-"],
+        check=True, input=body
+    )
+    cache[key] = digest
+    _save_applied_cache(cache)
+
+
+def apply_manifest_tier(manifest_paths: List[Path]):
+    """Apply a tier of independent manifests in one kubectl invocation.
+
+    Concatenating the docs into a single apply -f - stream pays the kubectl
+    startup cost once per tier instead of once per file. On failure each file
+    is re-applied individually so one bad manifest doesn't mask the rest.
+    """
+    cache = _load_applied_cache()
+    pending = []
+    for path in manifest_paths:
+        digest = hashlib.sha256(read_manifest(path)).hexdigest()
+        if _FORCE_APPLY or cache.get(_applied_cache_key(path)) != digest:
+            pending.append((path, digest))
+    if not pending:
+        return
+
+    combined = b"\n---\n".join(read_manifest(path) for path, _ in pending)
+    result = _run_streamed(
+        [*kubectl_base(), "apply", "--server-side=true",
+         "--field-manager=grafana-manager", "-f", "-"],
+        input=combined
+    )
+    if result.returncode != 0:
+        for path, _ in pending:
+            apply_manifest(path)
+        return
+    for path, digest in pending:
+        cache[_applied_cache_key(path)] = digest
+    _save_applied_cache(cache)
+
+
+def iter_kubectl_items(cmd: List[str]):
+    """Stream a kubectl -o json list response, yielding items as they parse.
+
+    The payload is parsed incrementally off the pipe instead of buffering the
+    whole (potentially multi-MB) response before json.loads can start, so peak
+    memory stays at one item and the first item is available at first byte.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+    try:
+        yield from ijson.items(proc.stdout, 'items.item')
+    finally:
+        proc.stdout.close()
+        proc.wait()
+
+
+@functools.lru_cache(maxsize=None)
+def _has_binary(name: str) -> bool:
+    """Whether a CLI tool is on PATH (cached for the process lifetime)"""
+    return shutil.which(name) is not None
+
+
+def run_kctl(*args: str) -> subprocess.CompletedProcess:
+    """Run kubectl with stdout and stderr kept strictly separate.
+
+    kubectl prints discovery and deprecation warnings on stderr even when
+    the command succeeds; keeping the streams apart stops them bleeding
+    into user-visible output, and stderr is surfaced dimmed only when the
+    command actually fails.
+    """
+    result = subprocess.run(
+        [*kubectl_base(), *args],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+    if result.returncode:
+        console.print(f"[stderr] {result.stderr.strip()}", style="dim red")
+    return result
+
+
+def _kubectl_query(*args: str, ttl: float = 5):
+    """Run a read-only kubectl query, memoized for a short TTL.
+
+    Identical queries issued within the window (menu redraws, repeated
+    probes during complete_reset) are served from _STATE_CACHE instead of
+    forking kubectl again. Returns (returncode, stdout).
+    """
+    def fetch():
+        result = subprocess.run(
+            [*kubectl_base(), *args], capture_output=True, text=True
+        )
+        return result.returncode, result.stdout
+    return _STATE_CACHE.get_or_call("kubectl:" + " ".join(args), ttl, fetch)
+
+
+def _kubectl_json(*args: str, ttl: float = 5):
+    """Parsed object from a read-only kubectl -o json query, memoized per TTL"""
+    rc, stdout = _kubectl_query(*args, "-o", "json", ttl=ttl)
+    if rc != 0:
+        return None
+    return orjson.loads(stdout)
+
+
+async def _run_async(cmd: List[str]):
+    """Run one CLI command without blocking the event loop"""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    return proc.returncode, stdout.decode(), stderr.decode()
+
+
+def run_parallel(*cmds: List[str]):
+    """Run independent CLI commands concurrently; returns (rc, stdout, stderr) per command"""
+    async def _gather():
+        return await asyncio.gather(*(_run_async(cmd) for cmd in cmds))
+    return asyncio.run(_gather())
+
+
+class ResourceCache:
+    """In-memory mirror of Grafana CRs and operator Deployments fed by watches.
+
+    Watch events (ADDED/MODIFIED/DELETED) keep the dicts current so interactive
+    reads become O(1) lookups instead of LIST calls against etcd. Each watcher
+    re-LISTs every RESYNC_SECONDS to recover from missed events and 410 Gone.
+    """
+
+    RESYNC_SECONDS = 60
+    GRAFANA_GROUP = "grafana.integreatly.org"
+    GRAFANA_VERSION = "v1beta1"
+
+    def __init__(self, cr_namespace: str = "grafana-system",
+                 deploy_namespace: str = "grafana-operator"):
+        self.cr_namespace = cr_namespace
+        self.deploy_namespace = deploy_namespace
+        self._grafanas: Dict[str, Dict] = {}
+        self._deployments: Dict[str, object] = {}
+        self._pods: Dict[str, object] = {}
+        self._lock = threading.RLock()
+        self._grafanas_synced = threading.Event()
+        self._deployments_synced = threading.Event()
+        self._pods_synced = threading.Event()
+        self._stopping = threading.Event()
+        self._started = False
+
+    def start(self):
+        """Start the watcher threads (idempotent)"""
+        if self._started:
+            return
+        self._started = True
+        atexit.register(self.stop)
+        threading.Thread(target=self._watch_grafanas, daemon=True).start()
+        threading.Thread(target=self._watch_deployments, daemon=True).start()
+        threading.Thread(target=self._watch_pods, daemon=True).start()
+
+    def stop(self):
+        """Ask the watcher loops to wind down (threads are daemons anyway)"""
+        self._stopping.set()
+
+    def grafanas(self) -> Optional[List[Dict]]:
+        """Snapshot of known Grafana CRs, or None if the cache isn't warm yet"""
+        if not self._grafanas_synced.is_set():
+            return None
+        with self._lock:
+            return list(self._grafanas.values())
+
+    def deployment(self, name: str) -> Optional[object]:
+        """Cached Deployment object, or None if the cache isn't warm yet"""
+        if not self._deployments_synced.is_set():
+            return None
+        with self._lock:
+            return self._deployments.get(name)
+
+    def pods(self, app: Optional[str] = None) -> Optional[List[object]]:
+        """Snapshot of cached pods, optionally filtered by the app label.
+
+        Returns None while the cache isn't warm so callers can fall back
+        to a direct LIST.
+        """
+        if not self._pods_synced.is_set():
+            return None
+        with self._lock:
+            pods = list(self._pods.values())
+        if app is not None:
+            pods = [p for p in pods if (p.metadata.labels or {}).get('app') == app]
+        return pods
+
+    def _watch_grafanas(self):
+        api = client.CustomObjectsApi(get_api_client())
+        while not self._stopping.is_set():
+            try:
+                listing = api.list_namespaced_custom_object(
+                    self.GRAFANA_GROUP, self.GRAFANA_VERSION,
+                    self.cr_namespace, "grafanas"
+                )
+                with self._lock:
+                    self._grafanas = {
+                        item['metadata']['name']: item
+                        for item in listing.get('items', [])
+                    }
+                self._grafanas_synced.set()
+                w = watch.Watch()
+                for event in w.stream(
+                    api.list_namespaced_custom_object,
+                    self.GRAFANA_GROUP, self.GRAFANA_VERSION,
+                    self.cr_namespace, "grafanas",
+                    timeout_seconds=self.RESYNC_SECONDS,
+                ):
+                    obj = event['object']
+                    name = obj['metadata']['name']
+                    with self._lock:
+                        if event['type'] == 'DELETED':
+                            self._grafanas.pop(name, None)
+                        else:
+                            self._grafanas[name] = obj
+            except Exception:
+                # API unreachable or watch expired; back off and re-LIST
+                self._grafanas_synced.clear()
+                time.sleep(5)
+
+    def _watch_deployments(self):
+        apps_v1 = client.AppsV1Api(get_api_client())
+        while not self._stopping.is_set():
+            try:
+                listing = apps_v1.list_namespaced_deployment(self.deploy_namespace)
+                with self._lock:
+                    self._deployments = {
+                        item.metadata.name: item for item in listing.items
+                    }
+                self._deployments_synced.set()
+                w = watch.Watch()
+                for event in w.stream(
+                    apps_v1.list_namespaced_deployment,
+                    namespace=self.deploy_namespace,
+                    timeout_seconds=self.RESYNC_SECONDS,
+                ):
+                    obj = event['object']
+                    name = obj.metadata.name
+                    with self._lock:
+                        if event['type'] == 'DELETED':
+                            self._deployments.pop(name, None)
+                        else:
+                            self._deployments[name] = obj
+            except Exception:
+                self._deployments_synced.clear()
+                time.sleep(5)
+
+    def _watch_pods(self):
+        core_v1 = client.CoreV1Api(get_api_client())
+        while not self._stopping.is_set():
+            try:
+                listing = core_v1.list_namespaced_pod(self.cr_namespace)
+                with self._lock:
+                    self._pods = {item.metadata.name: item for item in listing.items}
+                self._pods_synced.set()
+                w = watch.Watch()
+                for event in w.stream(
+                    core_v1.list_namespaced_pod,
+                    namespace=self.cr_namespace,
+                    timeout_seconds=self.RESYNC_SECONDS,
+                ):
+                    obj = event['object']
+                    name = obj.metadata.name
+                    with self._lock:
+                        if event['type'] == 'DELETED':
+                            self._pods.pop(name, None)
+                        else:
+                            self._pods[name] = obj
+            except Exception:
+                self._pods_synced.clear()
+                time.sleep(5)
+
+
+# Shared informer-style cache; watchers start lazily on first read
+_RESOURCE_CACHE = ResourceCache()
+
 
 @dataclass
 class Config:
@@ -43,17 +670,18 @@ class Config:
         self.project_root = Path(__file__).parent.parent
         self.config_dir = self.project_root / "config"
         self.kind_config = self.config_dir / "kind-config.yaml"
+        self.cluster_name = os.environ.get("GRAFANA_CLUSTER", "grafana-cluster")
         self.load_env()
     
     def load_env(self):
         """Load environment variables"""
         env_file = self.config_dir / ".env"
-        if env_file.exists():
-            with open(env_file) as f:
-                for line in f:
-                    if line.strip() and not line.startswith('#'):
-                        key, value = line.strip().split('=', 1)
-                        os.environ[key] = value
+        if not env_file.exists():
+            return
+        for key, value in _parse_env_file(str(env_file), env_file.stat().st_mtime):
+            # Skip the dict write when the value is already current
+            if os.environ.get(key) != value:
+                os.environ[key] = value
 
 
 class ClusterManager:
@@ -61,7 +689,14 @@ class ClusterManager:
     
     def __init__(self, cfg: Config):
         self.cfg = cfg
-        self.docker_client = docker.from_env()
+        self._docker = None
+
+    @property
+    def docker_client(self):
+        """Docker client, created on first use (the socket probe isn't free)"""
+        if self._docker is None:
+            self._docker = docker.from_env()
+        return self._docker
     
     def create_cluster(self) -> bool:
         """Create Kind cluster from config"""
@@ -75,6 +710,7 @@ class ClusterManager:
                 
                 cmd = [
                     "kind", "create", "cluster",
+                    "--name", self.cfg.cluster_name,
                     "--config", str(self.cfg.kind_config),
                     "--wait", "5m"
                 ]
@@ -82,6 +718,9 @@ class ClusterManager:
                 result = subprocess.run(cmd, capture_output=True, text=True)
                 
                 if result.returncode == 0:
+                    _drop_applied_cache_context()
+                    # Everything cached describes the old cluster
+                    _STATE_CACHE.invalidate()
                     console.print(" Cluster created successfully", style="bold green")
                     console.print("\n[INFO] Cluster Info:")
                     self.get_cluster_info()
@@ -104,6 +743,9 @@ class ClusterManager:
             result = subprocess.run(cmd, capture_output=True, text=True)
             
             if result.returncode == 0:
+                _drop_applied_cache_context()
+                # Every cached read (node table, probes, listings) is now stale
+                _STATE_CACHE.invalidate()
                 console.print(" Cluster deleted successfully", style="bold green")
                 return True
             else:
@@ -114,44 +756,57 @@ class ClusterManager:
             console.print(f" Error deleting cluster: {str(e)}", style="bold red")
             return False
     
-    def get_cluster_info(self) -> Dict:
+    # Only the four fields the node table shows, instead of full node objects
+    NODE_TABLE_JSONPATH = (
+        '{range .items[*]}{.metadata.name}{"\\t"}{.metadata.labels}{"\\t"}'
+        '{.status.conditions[-1:].type}{"\\t"}{.status.nodeInfo.kubeletVersion}{"\\n"}{end}'
+    )
+
+    def _fetch_cluster_info(self) -> List[tuple]:
+        """Fetch cluster and node rows (uncached); the two reads run concurrently"""
+        (_, clusters_out, _), (nodes_rc, nodes_out, _) = run_parallel(
+            ["kind", "get", "clusters"],
+            [*kubectl_base(), "get", "nodes", "-o", f"jsonpath={self.NODE_TABLE_JSONPATH}"],
+        )
+
+        clusters = clusters_out.strip().split('\n')
+        if self.cfg.cluster_name not in clusters:
+            return []
+
+        if nodes_rc != 0:
+            return []
+
+        rows = []
+        for line in nodes_out.strip().splitlines():
+            name, labels, condition, version = line.split('\t')
+            role = "control-plane" if 'node-role.kubernetes.io/control-plane' in labels else "worker"
+            rows.append((name, role, condition, version))
+        return rows
+
+    def get_cluster_info(self) -> List[tuple]:
         """Get cluster information"""
         try:
-            # Get cluster details
-            cmd = ["kind", "get", "clusters"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            clusters = result.stdout.strip().split('\n')
-            
-            if self.cfg.cluster_name not in clusters:
+            rows = _STATE_CACHE.get_or_call("cluster-info", 30, self._fetch_cluster_info)
+
+            if not rows:
                 console.print(f" Cluster '{self.cfg.cluster_name}' not found", style="bold red")
-                return {}
-            
-            # Get nodes
-            cmd = ["kubectl", "get", "nodes", "-o", "json"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                nodes_data = json.loads(result.stdout)
-                
-                table = Table(title="Cluster Nodes")
-                table.add_column("Node Name", style="cyan")
-                table.add_column("Role", style="magenta")
-                table.add_column("Status", style="green")
-                table.add_column("Version", style="yellow")
-                
-                for node in nodes_data['items']:
-                    name = node['metadata']['name']
-                    role = "control-plane" if "control-plane" in node['metadata']['labels'].get('node-role.kubernetes.io/control-plane', '') else "worker"
-                    status = node['status']['conditions'][-1]['type']
-                    version = node['status']['nodeInfo']['kubeletVersion']
-                    table.add_row(name, role, status, version)
-                
-                console.print(table)
-                return nodes_data
-            
+                return []
+
+            table = Table(title="Cluster Nodes")
+            table.add_column("Node Name", style="cyan")
+            table.add_column("Role", style="magenta")
+            table.add_column("Status", style="green")
+            table.add_column("Version", style="yellow")
+
+            for row in rows:
+                table.add_row(*row)
+
+            console.print(table)
+            return rows
+
         except Exception as e:
             console.print(f" Error getting cluster info: {str(e)}", style="bold red")
-            return {}
+            return []
     
     def export_kubeconfig(self) -> bool:
         """Export kubeconfig"""
@@ -178,10 +833,9 @@ class OperatorManager:
         self.cfg = cfg
         self.namespace = "grafana-operator"
         try:
-            config.load_kube_config()
-            self.k8s_client = client.ApiClient()
-            self.core_v1 = client.CoreV1Api()
-            self.apps_v1 = client.AppsV1Api()
+            self.k8s_client = get_api_client()
+            self.core_v1 = client.CoreV1Api(self.k8s_client)
+            self.apps_v1 = client.AppsV1Api(self.k8s_client)
         except Exception as e:
             console.print(f" Warning: Could not load Kubernetes config: {e}", style="yellow")
     
@@ -199,39 +853,40 @@ class OperatorManager:
                 # Try local CRDs first, fallback to remote URL
                 local_crds = self.cfg.config_dir / "grafana-operator" / "crds.yaml"
                 if local_crds.exists():
-                    self._apply_manifest(local_crds)
+                    apply_manifest(local_crds)
                 else:
-                    # Fallback to correct remote URL
+                    # Fallback to correct remote URL (fetched once, ETag-cached)
                     crd_url = "https://raw.githubusercontent.com/grafana/grafana-operator/master/deploy/kustomize/base/crds.yaml"
-                    cmd = ["kubectl", "apply", "-f", crd_url]
-                    subprocess.run(cmd, capture_output=True, check=True)
-                
-                # Create namespace
-                progress.update(task, description="Creating namespace...")
-                self._apply_manifest(self.cfg.config_dir / "grafana-operator" / "namespace.yaml")
-                
-                # Apply RBAC
-                progress.update(task, description="Applying RBAC...")
-                self._apply_manifest(self.cfg.config_dir / "grafana-operator" / "rbac.yaml")
-                
-                # Deploy operator
-                progress.update(task, description="Deploying operator...")
-                self._apply_manifest(self.cfg.config_dir / "grafana-operator" / "operator-deployment.yaml")
-                
-                # Wait for operator to be ready
-                progress.update(task, description="Waiting for operator to be ready...")
-                time.sleep(5)
-                self._wait_for_deployment("grafana-operator", self.namespace)
+                    body = fetch_remote_manifest(crd_url, "crds.yaml")
+                    _run_streamed(
+                        [*kubectl_base(), "apply", "-f", "-"],
+                        check=True, input=body
+                    )
                 
-                # Deploy PostgreSQL database (required for Grafana instances)
-                progress.update(task, description="Deploying PostgreSQL database...")
+                # Create namespace and RBAC (independent of each other)
+                progress.update(task, description="Creating namespace and RBAC...")
+                apply_manifest_tier([
+                    self.cfg.config_dir / "grafana-operator" / "namespace.yaml",
+                    self.cfg.config_dir / "grafana-operator" / "rbac.yaml",
+                ])
+
+                # Deploy operator and PostgreSQL database concurrently
+                progress.update(task, description="Deploying operator and database...")
+                tier = [self.cfg.config_dir / "grafana-operator" / "operator-deployment.yaml"]
                 postgresql_manifest = self.cfg.config_dir / "database" / "postgresql.yaml"
                 if postgresql_manifest.exists():
-                    self._apply_manifest(postgresql_manifest)
-                    console.print("   PostgreSQL deployed", style="green")
+                    tier.append(postgresql_manifest)
                 else:
                     console.print("  [WARNING]  PostgreSQL manifest not found", style="yellow")
+                apply_manifest_tier(tier)
+                if postgresql_manifest.exists():
+                    console.print("   PostgreSQL deployed", style="green")
+
+                # Wait for operator to be ready
+                progress.update(task, description="Waiting for operator to be ready...")
+                self._wait_for_deployment("grafana-operator", self.namespace)
                 
+            _STATE_CACHE.invalidate("operator-status")
             console.print(" Grafana Operator and Database installed successfully", style="bold green")
             return True
             
@@ -245,8 +900,10 @@ class OperatorManager:
             return False
         
         try:
-            cmd = ["kubectl", "delete", "namespace", self.namespace]
+            cmd = [*kubectl_base(), "delete", "namespace", self.namespace]
             subprocess.run(cmd, capture_output=True, check=True)
+            # The namespace delete takes the instances and pods with it
+            _STATE_CACHE.invalidate("operator-status", "grafana-instances", "health-pods")
             console.print(" Grafana Operator uninstalled successfully", style="bold green")
             return True
         except Exception as e:
@@ -256,15 +913,15 @@ class OperatorManager:
     def get_operator_status(self) -> Dict:
         """Get operator status"""
         try:
-            # Reload config to handle stale connections
-            try:
-                config.load_kube_config()
-                self.apps_v1 = client.AppsV1Api()
-            except:
-                pass  # Config already loaded
-            
-            deployment = self.apps_v1.read_namespaced_deployment("grafana-operator", self.namespace)
-            
+            _RESOURCE_CACHE.start()
+            deployment = _RESOURCE_CACHE.deployment("grafana-operator")
+            if deployment is None:
+                # Informer not warm yet (or operator gone): fall back to a direct read
+                deployment = _STATE_CACHE.get_or_call(
+                    "operator-status", 10,
+                    lambda: self.apps_v1.read_namespaced_deployment("grafana-operator", self.namespace)
+                )
+
             table = Table(title="Grafana Operator Status")
             table.add_column("Name", style="cyan")
             table.add_column("Ready", style="green")
@@ -296,7 +953,7 @@ class OperatorManager:
             console.print("[WARNING]  API connection issue, using kubectl fallback...", style="yellow")
             try:
                 result = subprocess.run(
-                    ["kubectl", "get", "deployment", "grafana-operator", "-n", self.namespace, "-o", "wide"],
+                    [*kubectl_base(), "get", "deployment", "grafana-operator", "-n", self.namespace, "-o", "wide"],
                     capture_output=True, text=True, check=True
                 )
                 console.print(result.stdout)
@@ -308,30 +965,55 @@ class OperatorManager:
     def view_operator_logs(self):
         """View operator logs"""
         try:
-            cmd = [
-                "kubectl", "logs", "-n", self.namespace,
-                "-l", "app=grafana-operator",
-                "--tail=100", "-f"
-            ]
-            subprocess.run(cmd)
+            pods = self.core_v1.list_namespaced_pod(
+                self.namespace, label_selector="app=grafana-operator"
+            ).items
+            if not pods:
+                console.print(" No operator pods found", style="yellow")
+                return
+
+            # Follow the log stream over the shared connection pool instead of
+            # forking kubectl logs -f
+            resp = self.core_v1.read_namespaced_pod_log(
+                pods[0].metadata.name, self.namespace,
+                follow=True, tail_lines=100, _preload_content=False
+            )
+            for chunk in resp.stream(4096):
+                console.out(chunk.decode(errors='replace'), end='')
         except KeyboardInterrupt:
             console.print("\n Log streaming stopped", style="bold yellow")
         except Exception as e:
             console.print(f" Error viewing logs: {str(e)}", style="bold red")
     
-    def _apply_manifest(self, manifest_path: Path):
-        """Apply Kubernetes manifest"""
-        cmd = ["kubectl", "apply", "-f", str(manifest_path)]
-        subprocess.run(cmd, capture_output=True, check=True)
-    
-    def _wait_for_deployment(self, name: str, namespace: str, timeout: int = 300):
-        """Wait for deployment to be ready"""
-        cmd = [
-            "kubectl", "wait", "--for=condition=available",
-            f"deployment/{name}", "-n", namespace,
-            f"--timeout={timeout}s"
-        ]
-        subprocess.run(cmd, capture_output=True, check=True)
+    def _wait_for_deployment(self, name: str, namespace: str, timeout: int = 300) -> bool:
+        """Wait for deployment to become Available via a watch stream"""
+        resource_version = None
+        for attempt in range(2):
+            w = watch.Watch()
+            try:
+                for event in w.stream(
+                    self.apps_v1.list_namespaced_deployment,
+                    namespace=namespace,
+                    field_selector=f"metadata.name={name}",
+                    resource_version=resource_version,
+                    timeout_seconds=timeout,
+                ):
+                    deployment = event['object']
+                    resource_version = deployment.metadata.resource_version
+                    conditions = deployment.status.conditions or []
+                    if any(c.type == 'Available' and c.status == 'True' for c in conditions):
+                        w.stop()
+                        return True
+                return False
+            except ApiException as e:
+                # 410 Gone: resource version expired, reconnect once from scratch
+                if e.status == 410 and attempt == 0:
+                    resource_version = None
+                    continue
+                raise
+            finally:
+                w.stop()
+        return False
 
 
 class GrafanaManager:
@@ -341,12 +1023,31 @@ class GrafanaManager:
         self.cfg = cfg
         self.namespace = "grafana-system"
         try:
-            config.load_kube_config()
-            self.core_v1 = client.CoreV1Api()
-            self.apps_v1 = client.AppsV1Api()
+            self.core_v1 = client.CoreV1Api(get_api_client())
+            self.apps_v1 = client.AppsV1Api(get_api_client())
         except Exception as e:
             console.print(f" Warning: Could not load Kubernetes config: {e}", style="yellow")
-    
+
+    def _wait_pod_ready(self, label_selector: str, namespace: str, timeout: int = 60) -> bool:
+        """Watch pods until one reports Ready instead of sleeping a fixed window"""
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                self.core_v1.list_namespaced_pod,
+                namespace=namespace,
+                label_selector=label_selector,
+                timeout_seconds=timeout,
+            ):
+                conditions = event['object'].status.conditions or []
+                if any(c.type == 'Ready' and c.status == 'True' for c in conditions):
+                    w.stop()
+                    return True
+        except Exception:
+            pass
+        finally:
+            w.stop()
+        return False
+
     def deploy_grafana(self) -> bool:
         """Deploy Grafana instance"""
         try:
@@ -358,83 +1059,94 @@ class GrafanaManager:
                 # Ensure PostgreSQL is running (it should be deployed with operator)
                 task = progress.add_task("Checking PostgreSQL...", total=None)
                 try:
-                    result = subprocess.run(
-                        ["kubectl", "get", "statefulset", "postgresql", "-n", "grafana-system"],
-                        capture_output=True, text=True, timeout=5
-                    )
-                    if result.returncode != 0:
+                    self.apps_v1.read_namespaced_stateful_set("postgresql", "grafana-system")
+                    console.print("   PostgreSQL already running", style="green")
+                except ApiException as e:
+                    if e.status == 404:
                         console.print("  [WARNING]  PostgreSQL not found, deploying now...", style="yellow")
-                        self._apply_manifest(self.cfg.config_dir / "database" / "postgresql.yaml")
-                        time.sleep(10)
                     else:
-                        console.print("   PostgreSQL already running", style="green")
+                        console.print("  [WARNING]  Could not check PostgreSQL, deploying to be safe...", style="yellow")
+                    apply_manifest(self.cfg.config_dir / "database" / "postgresql.yaml")
+                    self._wait_pod_ready("app=postgresql", "grafana-system", 60)
                 except:
                     console.print("  [WARNING]  Could not check PostgreSQL, deploying to be safe...", style="yellow")
-                    self._apply_manifest(self.cfg.config_dir / "database" / "postgresql.yaml")
-                    time.sleep(10)
-                
-                # Deploy storage
-                progress.update(task, description="Configuring storage...")
-                self._apply_manifest(self.cfg.config_dir / "storage" / "storage-class.yaml")
-                
-                # Deploy ConfigMaps
-                progress.update(task, description="Applying ConfigMaps...")
-                self._apply_manifest(self.cfg.config_dir / "configmaps" / "grafana-config.yaml")
-                self._apply_manifest(self.cfg.config_dir / "configmaps" / "resource-quotas.yaml")
+                    apply_manifest(self.cfg.config_dir / "database" / "postgresql.yaml")
+                    self._wait_pod_ready("app=postgresql", "grafana-system", 60)
                 
+                # Deploy storage and ConfigMaps (no ordering dependency)
+                progress.update(task, description="Configuring storage and ConfigMaps...")
+                apply_manifest_tier([
+                    self.cfg.config_dir / "storage" / "storage-class.yaml",
+                    self.cfg.config_dir / "configmaps" / "grafana-config.yaml",
+                    self.cfg.config_dir / "configmaps" / "resource-quotas.yaml",
+                ])
+
                 # Deploy Grafana instance
                 progress.update(task, description="Deploying Grafana instance...")
-                self._apply_manifest(self.cfg.config_dir / "grafana-instances" / "grafana-instance.yaml")
+                apply_manifest(self.cfg.config_dir / "grafana-instances" / "grafana-instance.yaml")
                 
-                # Deploy datasources
+                # Deploy datasources once the instance pod reports Ready
                 progress.update(task, description="Configuring datasources...")
-                time.sleep(10)
-                self._apply_manifest(self.cfg.config_dir / "grafana-instances" / "grafana-datasources.yaml")
+                self._wait_pod_ready("app=grafana-instance", self.namespace, 120)
+                apply_manifest(self.cfg.config_dir / "grafana-instances" / "grafana-datasources.yaml")
                 
-                # Deploy networking
+                # Deploy networking (services and policies are independent)
                 progress.update(task, description="Configuring networking...")
-                self._apply_manifest(self.cfg.config_dir / "networking" / "services.yaml")
-                self._apply_manifest(self.cfg.config_dir / "networking" / "network-policies.yaml")
+                apply_manifest_tier([
+                    self.cfg.config_dir / "networking" / "services.yaml",
+                    self.cfg.config_dir / "networking" / "network-policies.yaml",
+                ])
                 
-            console.print(" Grafana deployed successfully", style="bold green")
-            console.print("\n[INFO] Access Grafana at: http://localhost:3030")
-            console.print("Username: Username: admin")
-            console.print("Password: Password: Admin@12345")
+            _STATE_CACHE.invalidate("grafana-instances", "health-pods")
+            # One batched print: single console lock/width probe/flush
+            console.print(Group(
+                "[bold green] Grafana deployed successfully[/]",
+                "\n[INFO] Access Grafana at: http://localhost:3030",
+                "Username: admin",
+                "Password: Admin@12345",
+            ))
             return True
             
         except Exception as e:
             console.print(f" Error deploying Grafana: {str(e)}", style="bold red")
             return False
     
+    def _fetch_instances(self) -> Dict:
+        """Fetch Grafana custom resources (uncached, parsed incrementally)"""
+        cmd = [*kubectl_base(), "get", "grafanas", "-n", self.namespace, "-o", "json"]
+        return {'items': list(iter_kubectl_items(cmd))}
+
     def list_instances(self):
         """List Grafana instances"""
         try:
-            cmd = ["kubectl", "get", "grafanas", "-n", self.namespace, "-o", "json"]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            
-            data = json.loads(result.stdout)
-            
-            if not data.get('items'):
+            _RESOURCE_CACHE.start()
+            items = _RESOURCE_CACHE.grafanas()
+            if items is None:
+                # Informer not warm yet: fall back to a direct (TTL-cached) fetch
+                data = _STATE_CACHE.get_or_call("grafana-instances", 10, self._fetch_instances)
+                items = data.get('items', [])
+
+            if not items:
                 console.print("No Grafana instances found", style="yellow")
                 return
-            
+
             table = Table(title="Grafana Instances")
             table.add_column("Name", style="cyan")
             table.add_column("Status", style="green")
             table.add_column("URL", style="blue")
             table.add_column("Age", style="yellow")
             
-            for item in data['items']:
+            now = datetime.now(timezone.utc)
+            for item in items:
                 name = item['metadata']['name']
                 status = item.get('status', {}).get('stage', 'Unknown')
                 url = item.get('spec', {}).get('config', {}).get('server', {}).get('root_url', 'N/A')
-                
-                # Parse creation timestamp
+
+                # Parse creation timestamp (fromisoformat is C-implemented)
                 creation_time = item['metadata'].get('creationTimestamp', '')
                 if creation_time:
-                    from datetime import datetime, timezone
-                    created = datetime.strptime(creation_time.replace('Z', '+00:00').split('+')[0], '%Y-%m-%dT%H:%M:%S')
-                    age_seconds = (datetime.now(timezone.utc).replace(tzinfo=None) - created).total_seconds()
+                    created = datetime.fromisoformat(creation_time.replace('Z', '+00:00'))
+                    age_seconds = (now - created).total_seconds()
                     if age_seconds < 3600:
                         age = f"{age_seconds / 60:.0f}m"
                     elif age_seconds < 86400:
@@ -457,8 +1169,9 @@ class GrafanaManager:
             return False
         
         try:
-            cmd = ["kubectl", "delete", "grafana", name, "-n", self.namespace]
+            cmd = [*kubectl_base(), "delete", "grafana", name, "-n", self.namespace]
             subprocess.run(cmd, capture_output=True, check=True)
+            _STATE_CACHE.invalidate("grafana-instances", "health-pods")
             console.print(f" Instance '{name}' deleted successfully", style="bold green")
             return True
         except Exception as e:
@@ -472,7 +1185,7 @@ class GrafanaManager:
             console.print("Press Ctrl+C to stop", style="yellow")
             
             cmd = [
-                "kubectl", "port-forward", "-n", self.namespace,
+                *kubectl_base(), "port-forward", "-n", self.namespace,
                 "svc/grafana-instance-service", "3030:3000"
             ]
             subprocess.run(cmd)
@@ -480,11 +1193,29 @@ class GrafanaManager:
             console.print("\n Port forwarding stopped", style="bold yellow")
         except Exception as e:
             console.print(f" Error port forwarding: {str(e)}", style="bold red")
-    
-    def _apply_manifest(self, manifest_path: Path):
-        """Apply Kubernetes manifest"""
-        cmd = ["kubectl", "apply", "-f", str(manifest_path)]
-        subprocess.run(cmd, capture_output=True, check=True)
+
+
+# Parsed once at import; only the substitution runs per invocation
+_LIST_POD_TMPL = string.Template("""
+apiVersion: v1
+kind: Pod
+metadata:
+  name: $pod_name
+  namespace: $namespace
+spec:
+  restartPolicy: Never
+  containers:
+  - name: list
+    image: postgres:16-alpine
+    command: ["sh", "-c", "$command"]
+    volumeMounts:
+    - name: backup-storage
+      mountPath: /backups
+  volumes:
+  - name: backup-storage
+    persistentVolumeClaim:
+      claimName: $pvc
+""")
 
 
 class BackupManager:
@@ -494,26 +1225,37 @@ class BackupManager:
         self.cfg = cfg
         self.namespace = "grafana-system"
         self.backup_pvc = "postgresql-backup-pvc"
+        try:
+            self.core_v1 = client.CoreV1Api(get_api_client())
+            self.apps_v1 = client.AppsV1Api(get_api_client())
+            self.batch_v1 = client.BatchV1Api(get_api_client())
+        except Exception as e:
+            console.print(f" Warning: Could not load Kubernetes config: {e}", style="yellow")
     
     def _check_backup_health(self) -> bool:
+        """Check if backup infrastructure is healthy (cached for 60s)"""
+        return _STATE_CACHE.get_or_call("backup-health", 60, self._probe_backup_health)
+
+    def _probe_backup_health(self) -> bool:
         """Check if backup infrastructure is healthy"""
         try:
-            # Check if CronJob exists
-            result = subprocess.run(
-                ["kubectl", "get", "cronjob", "postgresql-backup", "-n", self.namespace],
-                capture_output=True, text=True
+            # Check if CronJob exists; jsonpath narrows the response to the
+            # bare name instead of a server-rendered table
+            rc, _ = _kubectl_query(
+                "get", "cronjob", "postgresql-backup", "-n", self.namespace,
+                "-o", "jsonpath={.metadata.name}"
             )
-            if result.returncode != 0:
+            if rc != 0:
                 console.print("[WARNING]  Backup CronJob not found. Attempting to create...", style="yellow")
                 self._deploy_backup_infrastructure()
                 return True
-            
+
             # Check if PVC exists
-            result = subprocess.run(
-                ["kubectl", "get", "pvc", self.backup_pvc, "-n", self.namespace],
-                capture_output=True, text=True
+            rc, _ = _kubectl_query(
+                "get", "pvc", self.backup_pvc, "-n", self.namespace,
+                "-o", "jsonpath={.metadata.name}"
             )
-            if result.returncode != 0:
+            if rc != 0:
                 console.print("[WARNING]  Backup PVC not found. Attempting to create...", style="yellow")
                 self._deploy_backup_infrastructure()
                 return True
@@ -528,13 +1270,102 @@ class BackupManager:
         try:
             backup_yaml = self.cfg.config_dir / "database" / "postgresql-backup.yaml"
             if backup_yaml.exists():
-                subprocess.run(["kubectl", "apply", "-f", str(backup_yaml)], check=True)
+                subprocess.run([*kubectl_base(), "apply", "-f", str(backup_yaml)], check=True)
                 console.print("[OK] Backup infrastructure deployed", style="green")
             else:
                 console.print("[ERROR] Backup configuration file not found", style="red")
         except Exception as e:
             console.print(f"[ERROR] Failed to deploy backup infrastructure: {e}", style="red")
-    
+
+    def wait_for_backup_pvc_bound(self, timeout: int = 60) -> bool:
+        """Watch the backup PVC until it reports phase Bound"""
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                self.core_v1.list_namespaced_persistent_volume_claim,
+                namespace=self.namespace,
+                field_selector=f"metadata.name={self.backup_pvc}",
+                timeout_seconds=timeout,
+            ):
+                if event['object'].status.phase == 'Bound':
+                    w.stop()
+                    return True
+        except Exception:
+            pass
+        finally:
+            w.stop()
+        return False
+
+    def wait_for_backup_job_created(self, job_name: str, timeout: int = 30) -> bool:
+        """Watch until the named backup job appears instead of a one-shot racy get"""
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                self.batch_v1.list_namespaced_job,
+                namespace=self.namespace,
+                field_selector=f"metadata.name={job_name}",
+                timeout_seconds=timeout,
+            ):
+                if event['type'] == 'ADDED':
+                    w.stop()
+                    return True
+        except Exception:
+            pass
+        finally:
+            w.stop()
+        return False
+
+    def wait_for_backup_job_complete(self, job_name: str, timeout: int = 60) -> bool:
+        """Watch the named backup job until it reports success"""
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                self.batch_v1.list_namespaced_job,
+                namespace=self.namespace,
+                field_selector=f"metadata.name={job_name}",
+                timeout_seconds=timeout,
+            ):
+                status = event['object'].status
+                if status.succeeded and status.succeeded >= 1:
+                    w.stop()
+                    return True
+        except Exception:
+            pass
+        finally:
+            w.stop()
+        return False
+
+    def verify_backup_resources(self) -> tuple:
+        """One batched round of the PVC/CronJob/Job verification reads.
+
+        The three GETs are issued together with async_req so they overlap
+        on the shared ApiClient instead of paying three sequential
+        round-trips. Returns (pvc_phase, cronjob_ok, jobs).
+        """
+        pvc_req = self.core_v1.read_namespaced_persistent_volume_claim(
+            "postgresql-backup-pvc", self.namespace, async_req=True
+        )
+        cron_req = self.batch_v1.read_namespaced_cron_job(
+            "postgresql-backup", self.namespace, async_req=True
+        )
+        jobs_req = self.batch_v1.list_namespaced_job(
+            self.namespace, label_selector="app=postgresql-backup", async_req=True
+        )
+        try:
+            pvc_phase = pvc_req.get().status.phase
+        except ApiException:
+            pvc_phase = ""
+        try:
+            cron_req.get()
+            cronjob_ok = True
+        except ApiException:
+            cronjob_ok = False
+        try:
+            jobs = jobs_req.get().items
+        except ApiException:
+            jobs = []
+        return pvc_phase, cronjob_ok, jobs
+
     def trigger_backup(self) -> bool:
         """Trigger manual backup with auto-healing"""
         try:
@@ -545,22 +1376,18 @@ class BackupManager:
             console.print("[PROCESSING] Triggering database backup...", style="bold blue")
             
             # Check if PostgreSQL is running
-            result = subprocess.run(
-                ["kubectl", "get", "pods", "-n", self.namespace, "-l", "app=postgresql", "-o", "json"],
-                capture_output=True, text=True, check=True
-            )
-            pods = json.loads(result.stdout)
-            
-            if not pods.get('items'):
+            pods = self.core_v1.list_namespaced_pod(self.namespace, label_selector="app=postgresql")
+
+            if not pods.items:
                 console.print("[WARNING]  PostgreSQL not running. Cannot backup.", style="red")
                 return False
-            
+
             # Check if PostgreSQL is ready
-            pod = pods['items'][0]
-            if pod['status']['phase'] != 'Running':
+            pod = pods.items[0]
+            if pod.status.phase != 'Running':
                 console.print("[WARNING]  PostgreSQL pod not ready. Waiting...", style="yellow")
                 subprocess.run(
-                    ["kubectl", "wait", "--for=condition=ready", "pod", "-l", "app=postgresql",
+                    [*kubectl_base(), "wait", "--for=condition=ready", "pod", "-l", "app=postgresql",
                      "-n", self.namespace, "--timeout=60s"],
                     capture_output=True
                 )
@@ -568,18 +1395,21 @@ class BackupManager:
             # Create backup job
             job_name = f"postgresql-backup-manual-{int(time.time())}"
             cmd = [
-                "kubectl", "create", "job", job_name,
+                *kubectl_base(), "create", "job", job_name,
                 "--from=cronjob/postgresql-backup", "-n", self.namespace
             ]
             subprocess.run(cmd, check=True, capture_output=True)
-            
-            console.print(f"[OK] Backup job '{job_name}' started", style="green")
-            console.print("[WAIT] Waiting for backup to complete...", style="yellow")
+            self._invalidate_backup_caches()
+
+            console.print(Group(
+                f"[green][OK] Backup job '{job_name}' started[/]",
+                "[yellow][WAIT] Waiting for backup to complete...[/]",
+            ))
             
             # Wait for job completion
             time.sleep(5)
             result = subprocess.run(
-                ["kubectl", "wait", "--for=condition=complete", f"job/{job_name}",
+                [*kubectl_base(), "wait", "--for=condition=complete", f"job/{job_name}",
                  "-n", self.namespace, "--timeout=120s"],
                 capture_output=True, text=True
             )
@@ -587,11 +1417,13 @@ class BackupManager:
             if result.returncode == 0:
                 # Show backup logs
                 logs = subprocess.run(
-                    ["kubectl", "logs", "-n", self.namespace, f"job/{job_name}"],
+                    [*kubectl_base(), "logs", "-n", self.namespace, f"job/{job_name}"],
                     capture_output=True, text=True
                 )
-                console.print("\n[bold green][INFO] Backup Log:[/]")
-                console.print(logs.stdout)
+                console.print(Group(
+                    "\n[bold green][INFO] Backup Log:[/]",
+                    logs.stdout,
+                ))
                 return True
             else:
                 console.print("[WARNING]  Backup job taking longer than expected. Check logs later.", style="yellow")
@@ -601,83 +1433,207 @@ class BackupManager:
             console.print(f"[ERROR] Backup failed: {e}", style="red")
             return False
     
+    LIST_BACKUPS_CMD = "sync && ls -lh /backups/*.sql.gz 2>/dev/null || echo 'No backups found'"
+
     def list_backups(self):
         """List all available backups"""
         try:
             if not self._check_backup_health():
                 return
-            
+
             console.print("[INFO] Listing available backups...", style="bold blue")
-            
-            # Create a temporary pod to list backups with sync command
-            timestamp = int(time.time())
-            pod_name = f"backup-list-temp-{timestamp}"
-            pod_yaml = f"""
-apiVersion: v1
-kind: Pod
-metadata:
-  name: {pod_name}
-  namespace: {self.namespace}
-spec:
-  restartPolicy: Never
-  containers:
-  - name: list
-    image: postgres:16-alpine
-    command: ["sh", "-c", "sync && ls -lh /backups/*.sql.gz 2>/dev/null || echo 'No backups found'"]
-    volumeMounts:
-    - name: backup-storage
-      mountPath: /backups
-  volumes:
-  - name: backup-storage
-    persistentVolumeClaim:
-      claimName: {self.backup_pvc}
-"""
-            
-            # Apply pod
-            proc = subprocess.Popen(
-                ["kubectl", "apply", "-f", "-"],
-                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-            )
-            stdout, stderr = proc.communicate(input=pod_yaml.encode())
-            
-            if proc.returncode != 0:
-                console.print(f"[ERROR] Failed to create list pod: {stderr.decode()}", style="red")
-                return
-            
-            # Wait for pod to complete (not just ready)
-            console.print("[WAIT] Fetching backup list...", style="yellow")
-            time.sleep(3)
-            
-            # Wait for pod completion
-            wait_result = subprocess.run(
-                ["kubectl", "wait", "--for=condition=Ready", f"pod/{pod_name}",
-                 "-n", self.namespace, "--timeout=30s"],
-                capture_output=True
-            )
-            
-            if wait_result.returncode == 0:
-                # Give extra time for the command to execute
-                time.sleep(3)
-            
-            # Get logs
-            result = subprocess.run(
-                ["kubectl", "logs", "-n", self.namespace, pod_name],
-                capture_output=True, text=True
-            )
-            
+
+            # Re-checks within 10s are served from cache; trigger/restore
+            # invalidate it so a fresh backup shows up immediately
+            output = _STATE_CACHE.get_or_call("backup-list", 10, self._fetch_backup_listing)
+
             console.print("\n[bold cyan]Available Backups:[/]")
-            if result.stdout and "No backups found" not in result.stdout:
-                console.print(result.stdout)
+            if output and "No backups found" not in output:
+                console.print(output)
             else:
                 console.print("[WARNING]  No backups found yet", style="yellow")
-            
-            # Cleanup
-            subprocess.run(
-                ["kubectl", "delete", "pod", pod_name, "-n", self.namespace, "--ignore-not-found=true"],
-                capture_output=True
-            )
         except Exception as e:
             console.print(f"[ERROR] Failed to list backups: {e}", style="red")
+
+    def _fetch_backup_listing(self) -> str:
+        """List backup files, preferring an exec in a pod that mounts the PVC"""
+        pod_with_pvc = self._find_backup_mount_pod()
+        if pod_with_pvc:
+            # Fast path: exec in the running pod that already mounts the PVC
+            return k8s_stream(
+                self.core_v1.connect_get_namespaced_pod_exec,
+                pod_with_pvc, self.namespace,
+                command=["sh", "-c", self.LIST_BACKUPS_CMD],
+                stderr=True, stdin=False, stdout=True, tty=False,
+            )
+        # Backup PVC isn't mounted anywhere; fall back to a short-lived pod
+        return self._list_backups_via_pod()
+
+    def _find_backup_mount_pod(self) -> Optional[str]:
+        """Name of a running pod that already mounts the backup PVC, if any"""
+        try:
+            # Both filters run server-side; only running postgres pods come back
+            pods = self.core_v1.list_namespaced_pod(
+                self.namespace,
+                label_selector="app=postgresql",
+                field_selector="status.phase=Running",
+            )
+            for pod in pods.items:
+                for volume in pod.spec.volumes or []:
+                    pvc = volume.persistent_volume_claim
+                    if pvc and pvc.claim_name == self.backup_pvc:
+                        return pod.metadata.name
+        except Exception:
+            pass
+        return None
+
+    def _wait_for_pod_phase(self, pod_name: str, timeout: int = 30) -> Optional[str]:
+        """Watch a pod until it reaches a terminal phase instead of polling"""
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                self.core_v1.list_namespaced_pod,
+                namespace=self.namespace,
+                field_selector=f"metadata.name={pod_name}",
+                timeout_seconds=timeout,
+            ):
+                phase = event['object'].status.phase
+                if phase in ('Succeeded', 'Failed'):
+                    w.stop()
+                    return phase
+        finally:
+            w.stop()
+        return None
+
+    def _wait_for_pods_deleted(self, namespace: str, label_selector: str, timeout: int = 60) -> bool:
+        """Watch until no pods match the selector instead of sleeping"""
+        remaining = {
+            p.metadata.name
+            for p in self.core_v1.list_namespaced_pod(namespace, label_selector=label_selector).items
+        }
+        if not remaining:
+            return True
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                self.core_v1.list_namespaced_pod,
+                namespace=namespace,
+                label_selector=label_selector,
+                timeout_seconds=timeout,
+            ):
+                if event['type'] == 'DELETED':
+                    remaining.discard(event['object'].metadata.name)
+                    if not remaining:
+                        w.stop()
+                        return True
+        finally:
+            w.stop()
+        return not remaining
+
+    def _wait_for_deployments_ready(self, namespace: str, timeout: int = 120) -> bool:
+        """Watch every deployment in a namespace until ready replicas match spec"""
+        listing = self.apps_v1.list_namespaced_deployment(namespace)
+        expected = {d.metadata.name: d.spec.replicas or 0 for d in listing.items}
+        ready = {name for name, want in expected.items() if want == 0}
+        if ready == set(expected):
+            return True
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                self.apps_v1.list_namespaced_deployment,
+                namespace=namespace,
+                timeout_seconds=timeout,
+            ):
+                obj = event['object']
+                want = expected.get(obj.metadata.name)
+                if want is None:
+                    continue
+                if (obj.status.ready_replicas or 0) >= want:
+                    ready.add(obj.metadata.name)
+                else:
+                    ready.discard(obj.metadata.name)
+                if ready == set(expected):
+                    w.stop()
+                    return True
+        finally:
+            w.stop()
+        return False
+
+    def _wait_for_job_pod(self, job_name: str, timeout: int = 60) -> Optional[str]:
+        """Watch for the pod a job spawns and return its name once logs exist"""
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                self.core_v1.list_namespaced_pod,
+                namespace=self.namespace,
+                label_selector=f"job-name={job_name}",
+                timeout_seconds=timeout,
+            ):
+                pod = event['object']
+                if pod.status.phase in ('Running', 'Succeeded', 'Failed'):
+                    w.stop()
+                    return pod.metadata.name
+        finally:
+            w.stop()
+        return None
+
+    def _wait_for_job(self, job_name: str, timeout: int = 300) -> bool:
+        """Watch a job until it succeeds or fails instead of polling kubectl wait"""
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                self.batch_v1.list_namespaced_job,
+                namespace=self.namespace,
+                field_selector=f"metadata.name={job_name}",
+                timeout_seconds=timeout,
+            ):
+                status = event['object'].status
+                if status.succeeded and status.succeeded >= 1:
+                    w.stop()
+                    return True
+                if status.failed and status.failed >= 1:
+                    w.stop()
+                    return False
+        finally:
+            w.stop()
+        return False
+
+    def _list_backups_via_pod(self) -> str:
+        """Run the backup listing in a short-lived pod mounting the backup PVC"""
+        pod_name = f"backup-list-temp-{int(time.time())}"
+        pod_yaml = _LIST_POD_TMPL.substitute(
+            pod_name=pod_name,
+            namespace=self.namespace,
+            command=self.LIST_BACKUPS_CMD,
+            pvc=self.backup_pvc,
+        )
+
+        proc = subprocess.Popen(
+            [*kubectl_base(), "apply", "-f", "-"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        stdout, stderr = proc.communicate(input=pod_yaml.encode())
+
+        if proc.returncode != 0:
+            raise RuntimeError(f"Failed to create list pod: {stderr.decode()}")
+
+        console.print("[WAIT] Fetching backup list...", style="yellow")
+        self._wait_for_pod_phase(pod_name, timeout=30)
+
+        result = subprocess.run(
+            [*kubectl_base(), "logs", "-n", self.namespace, pod_name],
+            capture_output=True, text=True
+        )
+
+        # Fire-and-forget cleanup: nothing downstream depends on the pod
+        # being gone, so don't block the menu on the delete round-trip
+        cleanup = subprocess.Popen(
+            [*kubectl_base(), "delete", "pod", pod_name, "-n", self.namespace,
+             "--ignore-not-found=true", "--wait=false"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        atexit.register(cleanup.wait)
+        return result.stdout
     
     def view_schedule(self):
         """View backup schedule"""
@@ -685,44 +1641,113 @@ spec:
             if not self._check_backup_health():
                 return
             
-            console.print("\n[bold blue] Backup Schedule:[/]")
-            subprocess.run(
-                ["kubectl", "get", "cronjob", "postgresql-backup", "-n", self.namespace, "-o", "wide"]
+            schedule_out, jobs_out = _STATE_CACHE.get_or_call(
+                "backup-schedule", 10, self._fetch_schedule
             )
-            
+            console.print("\n[bold blue] Backup Schedule:[/]")
+            console.out(schedule_out, end='')
+
             console.print("\n[bold blue]Recent Backup Jobs:[/]")
-            subprocess.run(
-                ["kubectl", "get", "jobs", "-n", self.namespace, "-l", "app=postgresql-backup",
-                 "--sort-by=.metadata.creationTimestamp"]
-            )
+            console.out(jobs_out, end='')
         except Exception as e:
             console.print(f"[ERROR] Failed to view schedule: {e}", style="red")
+
+    def _fetch_schedule(self) -> tuple:
+        """Fetch the cronjob summary and recent job listing concurrently"""
+        (_, schedule_out, _), (_, jobs_out, _) = run_parallel(
+            [*kubectl_base(), "get", "cronjob", "postgresql-backup", "-n", self.namespace, "-o", "wide"],
+            [*kubectl_base(), "get", "jobs", "-n", self.namespace, "-l", "app=postgresql-backup",
+             "--sort-by=.metadata.creationTimestamp"],
+        )
+        return schedule_out, jobs_out
+
+    def _invalidate_backup_caches(self):
+        """Drop cached backup views after a mutation so reads see it"""
+        _STATE_CACHE.invalidate("backup-list", "backup-schedule", "backup-health")
     
     def view_logs(self):
         """View latest backup logs"""
         try:
             console.print(" Fetching latest backup logs...", style="bold blue")
             
-            result = subprocess.run(
-                ["kubectl", "get", "jobs", "-n", self.namespace, "-l", "app=postgresql-backup",
-                 "--sort-by=.metadata.creationTimestamp", "-o", "json"],
-                capture_output=True, text=True, check=True
-            )
-            
-            jobs = json.loads(result.stdout)
-            
-            if not jobs.get('items'):
+            jobs = self.batch_v1.list_namespaced_job(
+                self.namespace, label_selector="app=postgresql-backup", limit=50
+            ).items
+
+            latest_job = None
+            if jobs:
+                latest_job = max(jobs, key=lambda j: j.metadata.creation_timestamp).metadata.name
+
+            if latest_job is None:
                 console.print("[WARNING]  No backup jobs found", style="yellow")
                 return
-            
-            latest_job = jobs['items'][-1]['metadata']['name']
+
             console.print(f"\n[bold cyan]Logs from: {latest_job}[/]")
-            subprocess.run(
-                ["kubectl", "logs", "-n", self.namespace, f"job/{latest_job}", "--tail=50"]
+            pods = self.core_v1.list_namespaced_pod(
+                self.namespace, label_selector=f"job-name={latest_job}"
+            ).items
+            if not pods:
+                console.print("[WARNING]  No pods found for job", style="yellow")
+                return
+            resp = self.core_v1.read_namespaced_pod_log(
+                pods[0].metadata.name, self.namespace,
+                tail_lines=50, _preload_content=False
             )
+            for chunk in resp.stream(4096):
+                console.out(chunk.decode(errors='replace'), end='')
         except Exception as e:
             console.print(f"[ERROR] Failed to view logs: {e}", style="red")
     
+    def _build_restore_job(self, job_name: str, backup_file: str) -> 'client.V1Job':
+        """Build the restore job from client models instead of templated YAML"""
+        secret_env = [
+            client.V1EnvVar(
+                name=key,
+                value_from=client.V1EnvVarSource(
+                    secret_key_ref=client.V1SecretKeySelector(name="postgresql-secret", key=key)
+                ),
+            )
+            for key in ("POSTGRES_DB", "POSTGRES_USER", "POSTGRES_PASSWORD")
+        ]
+        container = client.V1Container(
+            name="restore",
+            image="postgres:16-alpine",
+            command=["/bin/bash", "/scripts/restore.sh", backup_file],
+            env=secret_env,
+            volume_mounts=[
+                client.V1VolumeMount(name="backup-storage", mount_path="/backups"),
+                client.V1VolumeMount(name="scripts", mount_path="/scripts"),
+            ],
+        )
+        pod_spec = client.V1PodSpec(
+            restart_policy="Never",
+            containers=[container],
+            volumes=[
+                client.V1Volume(
+                    name="backup-storage",
+                    persistent_volume_claim=client.V1PersistentVolumeClaimVolumeSource(
+                        claim_name=self.backup_pvc
+                    ),
+                ),
+                client.V1Volume(
+                    name="scripts",
+                    config_map=client.V1ConfigMapVolumeSource(
+                        name="postgresql-backup-scripts", default_mode=0o755
+                    ),
+                ),
+            ],
+        )
+        return client.V1Job(
+            metadata=client.V1ObjectMeta(name=job_name, namespace=self.namespace),
+            spec=client.V1JobSpec(
+                ttl_seconds_after_finished=300,
+                template=client.V1PodTemplateSpec(
+                    metadata=client.V1ObjectMeta(labels={"app": "postgresql-restore"}),
+                    spec=pod_spec,
+                ),
+            ),
+        )
+
     def restore_backup(self):
         """Restore database from a backup"""
         try:
@@ -739,60 +1764,27 @@ spec:
             
             # List available backups first
             console.print("\n[INFO] Fetching available backups...", style="bold blue")
-            
-            # Create temporary pod to list backups
-            list_pod_yaml = f"""
-apiVersion: v1
-kind: Pod
-metadata:
-  name: backup-list-temp
-  namespace: {self.namespace}
-spec:
-  restartPolicy: Never
-  containers:
-  - name: list
-    image: postgres:16-alpine
-    command: ["sh", "-c", "ls -1 /backups/*.sql.gz 2>/dev/null | xargs -n 1 basename && sleep 5"]
-    volumeMounts:
-    - name: backup-storage
-      mountPath: /backups
-  volumes:
-  - name: backup-storage
-    persistentVolumeClaim:
-      claimName: {self.backup_pvc}
-"""
-            
-            proc = subprocess.Popen(
-                ["kubectl", "apply", "-f", "-"],
-                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-            )
-            proc.communicate(input=list_pod_yaml.encode())
-            
-            time.sleep(5)
-            result = subprocess.run(
-                ["kubectl", "logs", "-n", self.namespace, "backup-list-temp"],
-                capture_output=True, text=True
-            )
-            
-            # Cleanup list pod
-            subprocess.run(
-                ["kubectl", "delete", "pod", "backup-list-temp", "-n", self.namespace, "--ignore-not-found=true"],
-                capture_output=True
-            )
-            
-            if not result.stdout.strip():
+
+            output = self._fetch_backup_listing()
+
+            if not output.strip() or "No backups found" in output:
                 console.print("[ERROR] No backups found", style="red")
                 return False
-            
-            backups = [b.strip() for b in result.stdout.strip().split('\n') if b.strip()]
-            
+
+            # The listing is ls -lh output; keep the full lines for the picker
+            # but extract the bare filename for the restore job, since
+            # restore.sh prepends BACKUP_DIR itself
+            rows = [b.strip() for b in output.strip().split('\n')
+                    if b.strip().endswith('.sql.gz')]
+            backups = [os.path.basename(row.split()[-1]) for row in rows]
+
             if not backups:
                 console.print("[ERROR] No backups available", style="red")
                 return False
-            
+
             console.print("\n[bold cyan]Available Backups:[/]")
-            for idx, backup in enumerate(backups, 1):
-                console.print(f"  {idx}. {backup}")
+            for idx, row in enumerate(rows, 1):
+                console.print(f"  {idx}. {row}")
             
             # Ask user to select backup
             selection = Prompt.ask(
@@ -815,7 +1807,7 @@ spec:
             # Scale Grafana to 0 to prevent database connections during restore
             console.print(" Scaling Grafana to 0 replicas to prevent database connections...", style="yellow")
             scale_down = subprocess.run(
-                ["kubectl", "scale", "deployment", "-n", "grafana-system", "--all", "--replicas=0"],
+                [*kubectl_base(), "scale", "deployment", "-n", "grafana-system", "--all", "--replicas=0"],
                 capture_output=True, text=True
             )
             
@@ -823,110 +1815,55 @@ spec:
                 console.print(f"[WARNING]  Warning: Failed to scale down Grafana: {scale_down.stderr}", style="yellow")
             else:
                 console.print("[OK] Grafana scaled to 0 replicas", style="green")
-                time.sleep(5)  # Wait for pods to terminate
+                self._wait_for_pods_deleted("grafana-system", "app=grafana-instance", timeout=60)
             
             # Create restore job
-            restore_job_yaml = f"""
-apiVersion: batch/v1
-kind: Job
-metadata:
-  name: postgresql-restore-{int(time.time())}
-  namespace: {self.namespace}
-spec:
-  ttlSecondsAfterFinished: 300
-  template:
-    metadata:
-      labels:
-        app: postgresql-restore
-    spec:
-      restartPolicy: Never
-      containers:
-      - name: restore
-        image: postgres:16-alpine
-        command: ["/bin/bash", "/scripts/restore.sh", "{selected_backup}"]
-        env:
-        - name: POSTGRES_DB
-          valueFrom:
-            secretKeyRef:
-              name: postgresql-secret
-              key: POSTGRES_DB
-        - name: POSTGRES_USER
-          valueFrom:
-            secretKeyRef:
-              name: postgresql-secret
-              key: POSTGRES_USER
-        - name: POSTGRES_PASSWORD
-          valueFrom:
-            secretKeyRef:
-              name: postgresql-secret
-              key: POSTGRES_PASSWORD
-        volumeMounts:
-        - name: backup-storage
-          mountPath: /backups
-        - name: scripts
-          mountPath: /scripts
-      volumes:
-      - name: backup-storage
-        persistentVolumeClaim:
-          claimName: {self.backup_pvc}
-      - name: scripts
-        configMap:
-          name: postgresql-backup-scripts
-          defaultMode: 0755
-"""
-            
-            proc = subprocess.Popen(
-                ["kubectl", "apply", "-f", "-"],
-                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-            )
-            stdout, stderr = proc.communicate(input=restore_job_yaml.encode())
-            
-            if proc.returncode != 0:
-                console.print(f"[ERROR] Failed to create restore job: {stderr.decode()}", style="red")
-                return False
-            
             job_name = f"postgresql-restore-{int(time.time())}"
+            try:
+                self.batch_v1.create_namespaced_job(
+                    self.namespace, self._build_restore_job(job_name, selected_backup)
+                )
+            except ApiException as e:
+                console.print(f"[ERROR] Failed to create restore job: {e.reason}", style="red")
+                return False
+            self._invalidate_backup_caches()
+
             console.print(f"[OK] Restore job '{job_name}' started", style="green")
             console.print("[WAIT] Waiting for restore to complete (this may take a few minutes)...", style="yellow")
-            
-            # Wait for job completion
-            time.sleep(10)
-            result = subprocess.run(
-                ["kubectl", "wait", "--for=condition=complete", f"job/{job_name}",
-                 "-n", self.namespace, "--timeout=300s"],
-                capture_output=True, text=True
-            )
-            
-            # Show restore logs
-            logs = subprocess.run(
-                ["kubectl", "logs", "-n", self.namespace, f"job/{job_name}"],
-                capture_output=True, text=True
-            )
+
+            # Stream the restore log live while the job runs
             console.print("\n[bold green][INFO] Restore Log:[/]")
-            console.print(logs.stdout)
-            
-            if result.returncode == 0:
+            pod_name = self._wait_for_job_pod(job_name, timeout=60)
+            if pod_name:
+                try:
+                    resp = self.core_v1.read_namespaced_pod_log(
+                        pod_name, self.namespace, follow=True, _preload_content=False
+                    )
+                    for chunk in resp.stream(4096):
+                        console.out(chunk.decode(errors='replace'), end='')
+                except ApiException:
+                    console.print("[WARNING]  Could not stream restore log", style="yellow")
+
+            # Log stream ends with the pod; confirm the job's terminal state
+            succeeded = self._wait_for_job(job_name, timeout=300)
+
+            if succeeded:
                 console.print("\n[OK] Database restored successfully!", style="bold green")
                 
                 # Scale Grafana back to original replica count
                 console.print("\n Scaling Grafana back to original replica count...", style="bold blue")
                 scale_up = subprocess.run(
-                    ["kubectl", "scale", "deployment", "-n", "grafana-system", "--all", "--replicas=2"],
+                    [*kubectl_base(), "scale", "deployment", "-n", "grafana-system", "--all", "--replicas=2"],
                     capture_output=True, text=True
                 )
                 
                 if scale_up.returncode == 0:
                     console.print("[OK] Grafana scaled back to 2 replicas", style="green")
                     console.print("[WAIT] Waiting for pods to be ready...", style="yellow")
-                    
-                    # Wait for rollout to complete
-                    time.sleep(5)
-                    rollout_status = subprocess.run(
-                        ["kubectl", "rollout", "status", "deployment", "-n", "grafana-system", "--timeout=120s"],
-                        capture_output=True, text=True
-                    )
-                    
-                    if rollout_status.returncode == 0:
+
+                    # Single watch over the namespace's deployments instead
+                    # of a sleep plus one rollout-status poll per deployment
+                    if self._wait_for_deployments_ready("grafana-system", timeout=120):
                         console.print("[OK] All Grafana pods are ready with restored data!", style="bold green")
                         console.print("\n[cyan] Access Grafana at: http://localhost:3030[/]")
                     else:
@@ -948,49 +1885,53 @@ spec:
 
 class HealthChecker:
     """System health checker with auto-healing"""
-    
+
     def __init__(self, cfg: Config):
         self.cfg = cfg
-    
+        try:
+            api_client = get_api_client()
+            self.core_v1 = client.CoreV1Api(api_client)
+            self.apps_v1 = client.AppsV1Api(api_client)
+            self.batch_v1 = client.BatchV1Api(api_client)
+            self.version_api = client.VersionApi(api_client)
+        except Exception as e:
+            console.print(f" Warning: Could not load Kubernetes config: {e}", style="yellow")
+        self._pods_list_lock = threading.Lock()
+
     def check_all(self) -> Dict[str, bool]:
         """Comprehensive health check with auto-healing"""
         console.print("\n[CHECK] Running system health check...\n", style="bold blue")
-        
+
+        checks = [
+            ('cluster', self._check_cluster),
+            ('operator', self._check_operator),
+            ('grafana', self._check_grafana),
+            ('database', self._check_database),
+            ('backups', self._check_backups),
+        ]
+
         health = {}
-        
-        # Check Kind cluster
-        health['cluster'] = self._check_cluster()
-        
-        # Check Operator
-        health['operator'] = self._check_operator()
-        
-        # Check Grafana
-        health['grafana'] = self._check_grafana()
-        
-        # Check Database
-        health['database'] = self._check_database()
-        
-        # Check Backups
-        health['backups'] = self._check_backups()
-        
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            futures = [(name, pool.submit(_run_with_buffered_console, fn)) for name, fn in checks]
+            # Replay each check's output in declaration order once it finishes
+            for name, future in futures:
+                health[name], buf = future.result()
+                _BASE_CONSOLE.file.write(buf.getvalue())
+
         # Summary
         self._print_health_summary(health)
-        
+
         return health
     
     def _check_cluster(self) -> bool:
-        """Check Kind cluster health"""
+        """Check Kind cluster health (API probe cached for 30s)"""
         try:
-            result = subprocess.run(
-                ["kubectl", "cluster-info"],
-                capture_output=True, text=True, timeout=10
+            _STATE_CACHE.get_or_call(
+                "cluster-probe", 30,
+                lambda: self.version_api.get_code(_request_timeout=10),
             )
-            if result.returncode == 0:
-                console.print("[OK] Cluster: Healthy", style="green")
-                return True
-            else:
-                console.print("[ERROR] Cluster: Not responding", style="red")
-                return False
+            console.print("[OK] Cluster: Healthy", style="green")
+            return True
         except Exception:
             console.print("[ERROR] Cluster: Not accessible", style="red")
             return False
@@ -998,83 +1939,92 @@ class HealthChecker:
     def _check_operator(self) -> bool:
         """Check Grafana Operator health"""
         try:
-            result = subprocess.run(
-                ["kubectl", "get", "deployment", "grafana-operator", "-n", "grafana-operator", "-o", "json"],
-                capture_output=True, text=True
-            )
-            
-            if result.returncode != 0:
-                console.print("[WARNING]  Operator: Not deployed", style="yellow")
-                return False
-            
-            deployment = json.loads(result.stdout)
-            ready = deployment['status'].get('readyReplicas', 0)
-            desired = deployment['status'].get('replicas', 0)
-            
+            try:
+                deployment = self.apps_v1.read_namespaced_deployment("grafana-operator", "grafana-operator")
+            except ApiException as e:
+                if e.status == 404:
+                    console.print("[WARNING]  Operator: Not deployed", style="yellow")
+                    return False
+                raise
+
+            ready = deployment.status.ready_replicas or 0
+            desired = deployment.status.replicas or 0
+
             if ready == desired and ready > 0:
                 console.print(f"[OK] Operator: Healthy ({ready}/{desired} replicas)", style="green")
                 return True
             else:
                 console.print(f"[WARNING]  Operator: {ready}/{desired} replicas ready", style="yellow")
-                # Auto-heal: restart deployment
+                # Auto-heal: restart deployment (same patch kubectl rollout restart sends)
                 console.print(" Auto-healing: Restarting operator...", style="yellow")
-                subprocess.run(
-                    ["kubectl", "rollout", "restart", "deployment", "grafana-operator", "-n", "grafana-operator"],
-                    capture_output=True
-                )
+                patch = {"spec": {"template": {"metadata": {"annotations": {
+                    "kubectl.kubernetes.io/restartedAt": datetime.now(timezone.utc).isoformat()
+                }}}}}
+                self.apps_v1.patch_namespaced_deployment("grafana-operator", "grafana-operator", patch)
                 return False
         except Exception as e:
             console.print(f"[ERROR] Operator: Error - {e}", style="red")
             return False
     
+    def _list_pods(self, app: str) -> List[object]:
+        """Pods with the given app label, from the informer cache when warm"""
+        _RESOURCE_CACHE.start()
+        cached = _RESOURCE_CACHE.pods(app=app)
+        if cached is not None:
+            return cached
+        # Cold cache: one combined LIST shared by the grafana and database
+        # checks, partitioned by label here instead of one LIST per check
+        with self._pods_list_lock:
+            by_app = _STATE_CACHE.get_or_call("health-pods", 5, self._fetch_health_pods)
+        return by_app.get(app, [])
+
+    def _fetch_health_pods(self) -> Dict[str, List[object]]:
+        """Single pod LIST covering every app the health checks look at"""
+        items = self.core_v1.list_namespaced_pod(
+            "grafana-system",
+            label_selector="app in (grafana-instance, postgresql)",
+        ).items
+        by_app: Dict[str, List[object]] = {}
+        for pod in items:
+            by_app.setdefault((pod.metadata.labels or {}).get('app'), []).append(pod)
+        return by_app
+
     def _check_grafana(self) -> bool:
         """Check Grafana instance health"""
         try:
-            result = subprocess.run(
-                ["kubectl", "get", "pods", "-n", "grafana-system", "-l", "app=grafana-instance", "-o", "json"],
-                capture_output=True, text=True
-            )
-            
-            if result.returncode != 0:
-                console.print("[WARNING]  Grafana: Not deployed", style="yellow")
-                return False
-            
-            pods = json.loads(result.stdout)
-            items = pods.get('items', [])
-            
+            items = self._list_pods("grafana-instance")
+
             if not items:
                 console.print("[WARNING]  Grafana: No pods found", style="yellow")
                 return False
-            
-            running = sum(1 for pod in items if pod['status']['phase'] == 'Running')
+
+            running = sum(1 for pod in items if pod.status.phase == 'Running')
             total = len(items)
             
             if running == total:
                 console.print(f"[OK] Grafana: Healthy ({running}/{total} pods)", style="green")
                 # Check accessibility
                 try:
-                    result = subprocess.run(
-                        ["curl", "-s", "-o", "/dev/null", "-w", "%{http_code}", "http://localhost:3030/api/health"],
-                        capture_output=True, text=True, timeout=5
-                    )
-                    if "200" in result.stdout:
+                    resp = _HTTP_SESSION.get("http://localhost:3030/api/health", timeout=5)
+                    if resp.status_code == 200:
                         console.print("[OK] Grafana: Accessible at http://localhost:3030", style="green")
                     else:
                         console.print("[WARNING]  Grafana: Pods running but not accessible", style="yellow")
-                except:
+                except requests.RequestException:
                     console.print("ℹ  Grafana: Port check skipped", style="dim")
                 return True
             else:
-                console.print(f"[WARNING]  Grafana: {running}/{total} pods running", style="yellow")
-                # Auto-heal: restart failed pods
+                # Auto-heal: restart failed pods, reporting in one render pass
+                messages = [f"[yellow][WARNING]  Grafana: {running}/{total} pods running[/]"]
                 for pod in items:
-                    if pod['status']['phase'] != 'Running':
-                        pod_name = pod['metadata']['name']
-                        console.print(f" Auto-healing: Deleting pod {pod_name}...", style="yellow")
-                        subprocess.run(
-                            ["kubectl", "delete", "pod", pod_name, "-n", "grafana-system"],
-                            capture_output=True
-                        )
+                    if pod.status.phase != 'Running':
+                        pod_name = pod.metadata.name
+                        messages.append(f"[yellow] Auto-healing: Deleting pod {pod_name}...[/]")
+                        try:
+                            self.core_v1.delete_namespaced_pod(pod_name, "grafana-system")
+                        except ApiException:
+                            pass
+                console.print(Group(*messages))
                 return False
         except Exception as e:
             console.print(f"[ERROR] Grafana: Error - {e}", style="red")
@@ -1083,28 +2033,18 @@ class HealthChecker:
     def _check_database(self) -> bool:
         """Check PostgreSQL health"""
         try:
-            result = subprocess.run(
-                ["kubectl", "get", "pods", "-n", "grafana-system", "-l", "app=postgresql", "-o", "json"],
-                capture_output=True, text=True
-            )
-            
-            if result.returncode != 0:
-                console.print("[WARNING]  Database: Not deployed", style="yellow")
-                return False
-            
-            pods = json.loads(result.stdout)
-            items = pods.get('items', [])
-            
+            items = self._list_pods("postgresql")
+
             if not items:
                 console.print("[WARNING]  Database: No pods found", style="yellow")
                 return False
-            
+
             pod = items[0]
-            if pod['status']['phase'] == 'Running':
+            if pod.status.phase == 'Running':
                 console.print("[OK] Database: Healthy", style="green")
                 return True
             else:
-                console.print(f"[WARNING]  Database: Status - {pod['status']['phase']}", style="yellow")
+                console.print(f"[WARNING]  Database: Status - {pod.status.phase}", style="yellow")
                 return False
         except Exception as e:
             console.print(f"[ERROR] Database: Error - {e}", style="red")
@@ -1113,17 +2053,15 @@ class HealthChecker:
     def _check_backups(self) -> bool:
         """Check backup system health"""
         try:
-            result = subprocess.run(
-                ["kubectl", "get", "cronjob", "postgresql-backup", "-n", "grafana-system"],
-                capture_output=True, text=True
-            )
-            
-            if result.returncode == 0:
-                console.print("[OK] Backups: CronJob configured", style="green")
-                return True
-            else:
-                console.print("[WARNING]  Backups: Not configured", style="yellow")
-                return False
+            try:
+                self.batch_v1.read_namespaced_cron_job("postgresql-backup", "grafana-system")
+            except ApiException as e:
+                if e.status == 404:
+                    console.print("[WARNING]  Backups: Not configured", style="yellow")
+                    return False
+                raise
+            console.print("[OK] Backups: CronJob configured", style="green")
+            return True
         except Exception as e:
             console.print(f"[ERROR] Backups: Error - {e}", style="red")
             return False
@@ -1145,18 +2083,36 @@ class HealthChecker:
 
 class MonitoringManager:
     """Manage monitoring setup"""
-    
+
+    # How stale the local helm index may be before we refresh it
+    HELM_INDEX_MAX_AGE = 3600
+
     def __init__(self, cfg: Config):
         self.cfg = cfg
-    
+
+    def _helm_repo_fresh(self, repo_name: str) -> bool:
+        """True if the helm repo is configured and its index cache is recent.
+
+        Skipping `helm repo add` + `helm repo update` saves two network
+        round-trips on every deploy; a repo update within the last hour is
+        plenty for a chart that releases far less often than that.
+        """
+        try:
+            repos_file = Path.home() / ".config" / "helm" / "repositories.yaml"
+            if repo_name not in repos_file.read_text():
+                return False
+            index = Path.home() / ".cache" / "helm" / "repository" / f"{repo_name}-index.yaml"
+            return time.time() - index.stat().st_mtime < self.HELM_INDEX_MAX_AGE
+        except OSError:
+            return False
+
     def deploy_prometheus(self) -> bool:
         """Deploy Prometheus"""
         try:
             console.print(" Deploying Prometheus...", style="bold blue")
             
             # Check if Helm is installed
-            result = subprocess.run(["helm", "version"], capture_output=True)
-            if result.returncode != 0:
+            if not _has_binary("helm"):
                 console.print(" Helm not installed. Please install Helm first.", style="bold red")
                 return False
             
@@ -1167,13 +2123,14 @@ class MonitoringManager:
             ) as progress:
                 task = progress.add_task("Installing Prometheus...", total=None)
                 
-                # Add Helm repo
-                subprocess.run(
-                    ["helm", "repo", "add", "prometheus-community", 
-                     "https://prometheus-community.github.io/helm-charts"],
-                    capture_output=True
-                )
-                subprocess.run(["helm", "repo", "update"], capture_output=True)
+                # Add Helm repo unless it is already configured with a fresh index
+                if not self._helm_repo_fresh("prometheus-community"):
+                    subprocess.run(
+                        ["helm", "repo", "add", "prometheus-community",
+                         "https://prometheus-community.github.io/helm-charts"],
+                        capture_output=True
+                    )
+                    subprocess.run(["helm", "repo", "update"], capture_output=True)
                 
                 # Install Prometheus
                 cmd = [
@@ -1192,7 +2149,7 @@ class MonitoringManager:
                 
                 if result.returncode == 0:
                     progress.update(task, description="Applying ServiceMonitors...")
-                    self._apply_manifest(self.cfg.config_dir / "monitoring" / "service-monitors.yaml")
+                    apply_manifest(self.cfg.config_dir / "monitoring" / "service-monitors.yaml")
                     
                     console.print(" Prometheus deployed successfully", style="bold green")
                     return True
@@ -1210,8 +2167,7 @@ class MonitoringManager:
             console.print(" Deploying Istio...", style="bold blue")
             
             # Check if istioctl is installed
-            result = subprocess.run(["istioctl", "version"], capture_output=True)
-            if result.returncode != 0:
+            if not _has_binary("istioctl"):
                 console.print(" istioctl not installed. Please install Istio CLI first.", style="bold red")
                 console.print("Install: curl -L https://istio.io/downloadIstio | sh -", style="yellow")
                 return False
@@ -1231,14 +2187,14 @@ class MonitoringManager:
                     # Enable injection for grafana-system
                     progress.update(task, description="Enabling Istio injection...")
                     subprocess.run(
-                        ["kubectl", "label", "namespace", "grafana-system", "istio-injection=enabled", "--overwrite"],
+                        [*kubectl_base(), "label", "namespace", "grafana-system", "istio-injection=enabled", "--overwrite"],
                         capture_output=True
                     )
                     
                     # Apply Istio Gateway
                     progress.update(task, description="Applying Istio Gateway...")
                     time.sleep(5)
-                    self._apply_manifest(self.cfg.config_dir / "networking" / "istio-gateway.yaml")
+                    apply_manifest(self.cfg.config_dir / "networking" / "istio-gateway.yaml")
                     
                     console.print(" Istio deployed successfully", style="bold green")
                     return True
@@ -1249,11 +2205,6 @@ class MonitoringManager:
         except Exception as e:
             console.print(f" Error deploying Istio: {str(e)}", style="bold red")
             return False
-    
-    def _apply_manifest(self, manifest_path: Path):
-        """Apply Kubernetes manifest"""
-        cmd = ["kubectl", "apply", "-f", str(manifest_path)]
-        subprocess.run(cmd, capture_output=True, check=True)
 
 
 def print_banner():
@@ -1270,10 +2221,9 @@ def print_banner():
     console.print(banner, style="bold cyan")
 
 
-def main_menu():
-    """Display main menu"""
-    menu = Panel.fit(
-        """
+# Static menu panel, parsed and assembled once at import
+MAIN_MENU_PANEL = Panel.fit(
+    Text.from_markup("""
 [bold cyan]1.[/] Cluster Management
 [bold cyan]2.[/] Operator Management
 [bold cyan]3.[/] Grafana Instance Management
@@ -1282,38 +2232,65 @@ def main_menu():
 [bold cyan]6.[/] System Health Check
 [bold cyan]7.[/] Diagnostics & Logs
 [bold cyan]0.[/] Exit
-        """,
-        title="[bold magenta]Main Menu[/]",
-        border_style="cyan"
-    )
-    console.print(menu)
+        """),
+    title="[bold magenta]Main Menu[/]",
+    border_style="cyan"
+)
+
+
+def main_menu():
+    """Display main menu"""
+    console.print(MAIN_MENU_PANEL)
+
+
+CLUSTER_MENU_TEXT = Text.from_markup("""
+[bold cyan] Cluster Management [/]
+1. Create Cluster
+2. Delete Cluster
+3. Get Cluster Info
+4. Export Kubeconfig
+5. Complete Reset (Destroy & Rebuild)
+0. Back to Main Menu""")
 
 
 def cluster_menu(cluster_mgr: ClusterManager):
     """Cluster management menu"""
+    dispatch = {
+        "1": cluster_mgr.create_cluster,
+        "2": cluster_mgr.delete_cluster,
+        "3": cluster_mgr.get_cluster_info,
+        "4": cluster_mgr.export_kubeconfig,
+        "5": lambda: complete_reset(cluster_mgr),
+    }
+    choices = ["0", *dispatch]
     while True:
-        console.print("\n[bold cyan] Cluster Management [/]")
-        console.print("1. Create Cluster")
-        console.print("2. Delete Cluster")
-        console.print("3. Get Cluster Info")
-        console.print("4. Export Kubeconfig")
-        console.print("5. Complete Reset (Destroy & Rebuild)")
-        console.print("0. Back to Main Menu")
-        
-        choice = Prompt.ask("Select option", choices=["0", "1", "2", "3", "4", "5"])
-        
+        console.print(CLUSTER_MENU_TEXT)
+        choice = Prompt.ask("Select option", choices=choices)
         if choice == "0":
             break
-        elif choice == "1":
-            cluster_mgr.create_cluster()
-        elif choice == "2":
-            cluster_mgr.delete_cluster()
-        elif choice == "3":
-            cluster_mgr.get_cluster_info()
-        elif choice == "4":
-            cluster_mgr.export_kubeconfig()
-        elif choice == "5":
-            complete_reset(cluster_mgr)
+        dispatch[choice]()
+
+
+# Final reset summary; entirely static, so parsed and grouped once at import
+RESET_SUMMARY = Group(
+    Text("\n" + "=" * 60, style="cyan"),
+    Text.from_markup("[bold green] FULLY AUTOMATED DEPLOYMENT COMPLETE![/]"),
+    Text.from_markup("\n[cyan][OK] Everything is deployed and running:[/]"),
+    Text("   Kind Cluster (3 nodes)"),
+    Text("   Grafana Operator (2 replicas)"),
+    Text("   PostgreSQL Database (with 20Gi storage)"),
+    Text("   Grafana Instance (2 replicas)"),
+    Text("   Prometheus Monitoring (kube-prometheus-stack)"),
+    Text("   ServiceMonitors (Grafana, Operator, PostgreSQL)"),
+    Text("   NodePort Service (permanent access)"),
+    Text("   Automated Backups (50Gi PVC, CronJob, initial backup)"),
+    Text.from_markup("\n[bold green] Access Grafana:[/]"),
+    Text("  URL: http://localhost:3030"),
+    Text("  Username: admin"),
+    Text("  Password: Admin@12345"),
+    Text.from_markup("\n[cyan][TIP] No manual steps required - everything is ready to use![/]"),
+    Text("=" * 60 + "\n", style="cyan"),
+)
 
 
 def complete_reset(cluster_mgr: ClusterManager):
@@ -1338,20 +2315,29 @@ def complete_reset(cluster_mgr: ClusterManager):
         cluster_mgr.delete_cluster()
         time.sleep(3)
         
-        # Step 2: Clean up Docker resources
+        # Step 2: Clean up Docker resources belonging to this cluster only,
+        # instead of a global prune that nukes unrelated images and caches
         console.print("\n[bold blue]Step 2/10: Cleaning up Docker resources...[/]")
-        subprocess.run(["docker", "system", "prune", "-f"], capture_output=True)
-        console.print("[OK] Docker cleanup complete", style="green")
+        kind_label = f"io.x-k8s.kind.cluster={cluster_mgr.cfg.cluster_name}"
+        try:
+            docker_client = cluster_mgr.docker_client
+            for container in docker_client.containers.list(all=True, filters={"label": kind_label}):
+                container.remove(force=True)
+            for volume in docker_client.volumes.list(filters={"label": kind_label}):
+                volume.remove(force=True)
+            console.print("[OK] Docker cleanup complete", style="green")
+        except Exception as e:
+            console.print(f"[WARNING]  Docker cleanup skipped: {e}", style="yellow")
         
         # Step 3: Verify cleanup
         # Step 3: Verify cleanup
         console.print("\n[bold blue]Step 3/10: Verifying cleanup...[/]")
         result = subprocess.run(["kind", "get", "clusters"], capture_output=True, text=True)
-        if "grafana-cluster" not in result.stdout:
+        if cluster_mgr.cfg.cluster_name not in result.stdout:
             console.print("[OK] Cluster completely removed", style="green")
         else:
             console.print("[WARNING]  Cluster still exists, retrying...", style="yellow")
-            subprocess.run(["kind", "delete", "cluster", "--name", "grafana-cluster"], capture_output=True)
+            subprocess.run(["kind", "delete", "cluster", "--name", cluster_mgr.cfg.cluster_name], capture_output=True)
             time.sleep(2)
         
         # Step 4: Rebuild cluster
@@ -1365,7 +2351,7 @@ def complete_reset(cluster_mgr: ClusterManager):
         # Step 5: Verify new cluster
         console.print("\n[bold blue]Step 5/10: Verifying new cluster...[/]")
         time.sleep(5)
-        result = subprocess.run(["kubectl", "get", "nodes"], capture_output=True, text=True)
+        result = subprocess.run([*kubectl_base(), "get", "nodes"], capture_output=True, text=True)
         if result.returncode == 0:
             console.print("[OK] New cluster is ready!", style="bold green")
             console.print("\n[cyan]Nodes:[/]")
@@ -1386,26 +2372,32 @@ def complete_reset(cluster_mgr: ClusterManager):
         # Wait for operator to stabilize
         time.sleep(10)
         
-        # Step 7: Deploy Grafana Instance
+        # Steps 7+8: Grafana and Prometheus don't depend on each other, so
+        # the two deploys run in parallel threads with buffered output
         console.print("\n[bold blue]Step 7/10: Deploying Grafana Instance...[/]")
+        console.print("[bold blue]Step 8/10: Deploying Prometheus Monitoring (in parallel)...[/]")
         grafana_mgr = GrafanaManager(cluster_mgr.cfg)
-        if grafana_mgr.deploy_grafana():
+        monitoring_mgr = MonitoringManager(cluster_mgr.cfg)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            grafana_future = pool.submit(_run_with_buffered_console, grafana_mgr.deploy_grafana)
+            prometheus_future = pool.submit(_run_with_buffered_console, monitoring_mgr.deploy_prometheus)
+            grafana_ok, buf = grafana_future.result()
+            _BASE_CONSOLE.file.write(buf.getvalue())
+            prometheus_ok, buf = prometheus_future.result()
+            _BASE_CONSOLE.file.write(buf.getvalue())
+
+        if grafana_ok:
             console.print("[OK] Grafana deployed", style="green")
         else:
             console.print("[ERROR] Failed to deploy Grafana", style="red")
             return
-        
-        # Step 8: Deploy Monitoring (Prometheus)
-        console.print("\n[bold blue]Step 8/10: Deploying Prometheus Monitoring...[/]")
-        monitoring_mgr = MonitoringManager(cluster_mgr.cfg)
-        if monitoring_mgr.deploy_prometheus():
+
+        if prometheus_ok:
             console.print("[OK] Prometheus monitoring deployed", style="green")
         else:
             console.print("[WARNING]  Prometheus deployment skipped or failed", style="yellow")
-        
-        # Wait for Prometheus to stabilize
-        time.sleep(5)
-        
+
         # Step 9: Configure Backups
         console.print("\n[bold blue]Step 9/10: Configuring automated backups...[/]")
         backup_mgr = BackupManager(cluster_mgr.cfg)
@@ -1414,37 +2406,37 @@ def complete_reset(cluster_mgr: ClusterManager):
         backup_yaml = cluster_mgr.cfg.config_dir / "database" / "postgresql-backup.yaml"
         if backup_yaml.exists():
             try:
-                subprocess.run(["kubectl", "apply", "-f", str(backup_yaml)], 
+                subprocess.run([*kubectl_base(), "apply", "-f", str(backup_yaml)], 
                              capture_output=True, text=True, check=True)
                 console.print("[OK] Backup infrastructure deployed", style="green")
                 
-                # Wait for backup PVC to be bound
-                time.sleep(5)
-                result = subprocess.run(
-                    ["kubectl", "get", "pvc", "postgresql-backup-pvc", "-n", "grafana-system", "-o", "jsonpath={.status.phase}"],
-                    capture_output=True, text=True
-                )
-                if result.stdout.strip() == "Bound":
+                # Block on the PVC actually binding rather than sleeping,
+                # then verify PVC, CronJob and initial job in one batched round
+                backup_mgr.wait_for_backup_pvc_bound(timeout=60)
+                pvc_phase, cronjob_ok, jobs = backup_mgr.verify_backup_resources()
+                if pvc_phase == "Bound":
                     console.print("[OK] Backup PVC bound successfully", style="green")
                 else:
-                    console.print(f"[WARNING]  Backup PVC status: {result.stdout.strip()}", style="yellow")
-                
-                # Verify CronJob created
-                result = subprocess.run(
-                    ["kubectl", "get", "cronjob", "postgresql-backup", "-n", "grafana-system"],
-                    capture_output=True, text=True
-                )
-                if result.returncode == 0:
+                    console.print(f"[WARNING]  Backup PVC status: {pvc_phase}", style="yellow")
+
+                if cronjob_ok:
                     console.print("[OK] Backup CronJob configured (daily at 2 AM)", style="green")
-                    
-                    # Trigger initial backup to verify it works
+
+                    # Trigger initial backup to verify it works; if the job
+                    # isn't in the snapshot yet, watch for it to appear
+                    # instead of declaring a false negative
                     console.print("[PROCESSING] Triggering initial backup test...", style="cyan")
-                    result = subprocess.run(
-                        ["kubectl", "get", "job", "-n", "grafana-system", "-l", "app=postgresql-backup"],
-                        capture_output=True, text=True
-                    )
-                    if "postgresql-backup-manual" in result.stdout:
+                    if (any("postgresql-backup-manual" in j.metadata.name for j in jobs)
+                            or backup_mgr.wait_for_backup_job_created(
+                                "postgresql-backup-manual", timeout=30)):
                         console.print("[OK] Initial backup job created", style="green")
+                        # The wait returns the instant .status.succeeded flips,
+                        # so the final health check sees a finished backup
+                        if backup_mgr.wait_for_backup_job_complete(
+                                "postgresql-backup-manual", timeout=60):
+                            console.print("[OK] Initial backup completed", style="green")
+                        else:
+                            console.print("[WARNING]  Initial backup still running; check logs later", style="yellow")
                 else:
                     console.print("[WARNING]  CronJob verification failed", style="yellow")
             except Exception as e:
@@ -1452,231 +2444,278 @@ def complete_reset(cluster_mgr: ClusterManager):
         else:
             console.print("[WARNING]  Backup configuration file not found", style="yellow")
         
-        # Step 10: Final verification
+        # Step 10: Final verification; the preceding steps already block on
+        # their resources being ready, so no settling sleep is needed
         console.print("\n[bold blue]Step 10/10: Running health check...[/]")
-        time.sleep(5)
         health_checker = HealthChecker(cluster_mgr.cfg)
         health_checker.check_all()
         
         # Summary
-        console.print("\n" + "="*60, style="cyan")
-        console.print("[bold green] FULLY AUTOMATED DEPLOYMENT COMPLETE![/]")
-        console.print("\n[cyan][OK] Everything is deployed and running:[/]")
-        console.print("   Kind Cluster (3 nodes)")
-        console.print("   Grafana Operator (2 replicas)")
-        console.print("   PostgreSQL Database (with 20Gi storage)")
-        console.print("   Grafana Instance (2 replicas)")
-        console.print("   Prometheus Monitoring (kube-prometheus-stack)")
-        console.print("   ServiceMonitors (Grafana, Operator, PostgreSQL)")
-        console.print("   NodePort Service (permanent access)")
-        console.print("   Automated Backups (50Gi PVC, CronJob, initial backup)")
-        console.print("\n[bold green] Access Grafana:[/]")
-        console.print("  URL: http://localhost:3030")
-        console.print("  Username: admin")
-        console.print("  Password: Admin@12345")
-        console.print("\n[cyan][TIP] No manual steps required - everything is ready to use![/]loyment")
-        console.print("  4. All resources will be created automatically!")
-        console.print("="*60 + "\n", style="cyan")
-        
+        console.print(RESET_SUMMARY)
+
     except Exception as e:
         console.print(f"\n[ERROR] Reset failed: {e}", style="bold red")
         console.print("You may need to manually clean up with: kind delete cluster --name grafana-cluster", style="yellow")
 
 
+OPERATOR_MENU_TEXT = Text.from_markup("""
+[bold cyan] Operator Management [/]
+1. Install Grafana Operator
+2. Uninstall Operator
+3. Check Operator Status
+4. View Operator Logs
+0. Back to Main Menu""")
+
+
 def operator_menu(operator_mgr: OperatorManager):
     """Operator management menu"""
+    dispatch = {
+        "1": operator_mgr.install_operator,
+        "2": operator_mgr.uninstall_operator,
+        "3": operator_mgr.get_operator_status,
+        "4": operator_mgr.view_operator_logs,
+    }
+    choices = ["0", *dispatch]
     while True:
-        console.print("\n[bold cyan] Operator Management [/]")
-        console.print("1. Install Grafana Operator")
-        console.print("2. Uninstall Operator")
-        console.print("3. Check Operator Status")
-        console.print("4. View Operator Logs")
-        console.print("0. Back to Main Menu")
-        
-        choice = Prompt.ask("Select option", choices=["0", "1", "2", "3", "4"])
-        
+        console.print(OPERATOR_MENU_TEXT)
+        choice = Prompt.ask("Select option", choices=choices)
         if choice == "0":
             break
-        elif choice == "1":
-            operator_mgr.install_operator()
-        elif choice == "2":
-            operator_mgr.uninstall_operator()
-        elif choice == "3":
-            operator_mgr.get_operator_status()
-        elif choice == "4":
-            operator_mgr.view_operator_logs()
+        dispatch[choice]()
+
+
+GRAFANA_MENU_TEXT = Text.from_markup("""
+[bold cyan] Grafana Instance Management [/]
+1. Deploy Grafana Instance
+2. List Grafana Instances
+3. Delete Grafana Instance
+4. Port Forward to Grafana
+0. Back to Main Menu""")
 
 
 def grafana_menu(grafana_mgr: GrafanaManager):
     """Grafana instance management menu"""
+    def delete_instance():
+        name = Prompt.ask("Enter instance name", default="grafana-instance")
+        grafana_mgr.delete_instance(name)
+
+    dispatch = {
+        "1": grafana_mgr.deploy_grafana,
+        "2": grafana_mgr.list_instances,
+        "3": delete_instance,
+        "4": grafana_mgr.port_forward,
+    }
+    choices = ["0", *dispatch]
     while True:
-        console.print("\n[bold cyan] Grafana Instance Management [/]")
-        console.print("1. Deploy Grafana Instance")
-        console.print("2. List Grafana Instances")
-        console.print("3. Delete Grafana Instance")
-        console.print("4. Port Forward to Grafana")
-        console.print("0. Back to Main Menu")
-        
-        choice = Prompt.ask("Select option", choices=["0", "1", "2", "3", "4"])
-        
+        console.print(GRAFANA_MENU_TEXT)
+        choice = Prompt.ask("Select option", choices=choices)
         if choice == "0":
             break
-        elif choice == "1":
-            grafana_mgr.deploy_grafana()
-        elif choice == "2":
-            grafana_mgr.list_instances()
-        elif choice == "3":
-            name = Prompt.ask("Enter instance name", default="grafana-instance")
-            grafana_mgr.delete_instance(name)
-        elif choice == "4":
-            grafana_mgr.port_forward()
+        dispatch[choice]()
+
+
+MONITORING_MENU_TEXT = Text.from_markup("""
+[bold cyan] Monitoring & Infrastructure [/]
+1. Deploy Prometheus
+2. Deploy Istio
+0. Back to Main Menu""")
 
 
 def monitoring_menu(monitoring_mgr: MonitoringManager):
     """Monitoring & Infrastructure menu"""
+    dispatch = {
+        "1": monitoring_mgr.deploy_prometheus,
+        "2": monitoring_mgr.deploy_istio,
+    }
+    choices = ["0", *dispatch]
     while True:
-        console.print("\n[bold cyan] Monitoring & Infrastructure [/]")
-        console.print("1. Deploy Prometheus")
-        console.print("2. Deploy Istio")
-        console.print("0. Back to Main Menu")
-        
-        choice = Prompt.ask("Select option", choices=["0", "1", "2"])
-        
+        console.print(MONITORING_MENU_TEXT)
+        choice = Prompt.ask("Select option", choices=choices)
         if choice == "0":
             break
-        elif choice == "1":
-            monitoring_mgr.deploy_prometheus()
-        elif choice == "2":
-            monitoring_mgr.deploy_istio()
+        dispatch[choice]()
+
+
+DIAGNOSTICS_MENU_TEXT = Text.from_markup("""
+[bold cyan] Diagnostics & Logs [/]
+1. Check All Resources
+2. View Pod Logs
+3. Describe Resource
+0. Back to Main Menu""")
+
+
+def _diag_check_all_resources():
+    namespaces = ["grafana-system", "grafana-operator", "monitoring", "istio-system"]
+    # The four scans are RTT-bound; run them concurrently and print
+    # each captured block atomically in namespace order
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = {
+            ns: pool.submit(
+                subprocess.run,
+                # --chunk-size=0 disables list pagination so big namespaces
+                # (monitoring under kube-prometheus-stack) come back in one
+                # round-trip instead of several 500-item pages
+                [*kubectl_base(), "get", "all", "-n", ns, "--chunk-size=0"],
+                capture_output=True, text=True,
+            )
+            for ns in namespaces
+        }
+        for ns in namespaces:
+            result = futures[ns].result()
+            console.print(f"\n[bold]Namespace: {ns}[/]")
+            console.out(result.stdout or result.stderr, end='')
+
+
+def _diag_view_pod_logs():
+    namespace = Prompt.ask("Enter namespace", default="grafana-system")
+    pod = Prompt.ask("Enter pod name")
+    try:
+        # Stream via the shared ApiClient so the first lines render
+        # immediately and memory stays constant; describe stays kubectl
+        # since the client has no equivalent rendering
+        core_v1 = client.CoreV1Api(get_api_client())
+        resp = core_v1.read_namespaced_pod_log(
+            pod, namespace, tail_lines=100, _preload_content=False
+        )
+        try:
+            for chunk in resp.stream(4096):
+                console.out(chunk.decode(errors='replace'), end='')
+        except KeyboardInterrupt:
+            resp.release_conn()
+            console.print("\n[dim]Log view interrupted[/]")
+    except ApiException as e:
+        console.print(f"Error: {e.reason}", style="red")
+    except Exception as e:
+        console.print(f"Error: {e}", style="red")
+
+
+def _diag_describe_resource():
+    namespace = Prompt.ask("Enter namespace", default="grafana-system")
+    resource_type = Prompt.ask("Enter resource type (pod/deployment/svc)")
+    resource_name = Prompt.ask("Enter resource name")
+    try:
+        result = run_kctl("describe", resource_type, resource_name, "-n", namespace)
+        console.out(result.stdout, end='')
+    except Exception as e:
+        console.print(f"Error: {e}", style="red")
 
 
 def diagnostics_menu():
     """Diagnostics menu"""
+    dispatch = {
+        "1": _diag_check_all_resources,
+        "2": _diag_view_pod_logs,
+        "3": _diag_describe_resource,
+    }
+    choices = ["0", *dispatch]
     while True:
-        console.print("\n[bold cyan] Diagnostics & Logs [/]")
-        console.print("1. Check All Resources")
-        console.print("2. View Pod Logs")
-        console.print("3. Describe Resource")
-        console.print("0. Back to Main Menu")
-        
-        choice = Prompt.ask("Select option", choices=["0", "1", "2", "3"])
-        
+        console.print(DIAGNOSTICS_MENU_TEXT)
+        choice = Prompt.ask("Select option", choices=choices)
         if choice == "0":
             break
-        elif choice == "1":
-            namespaces = ["grafana-system", "grafana-operator", "monitoring", "istio-system"]
-            for ns in namespaces:
-                console.print(f"\n[bold]Namespace: {ns}[/]")
-                subprocess.run(["kubectl", "get", "all", "-n", ns])
-        elif choice == "2":
-            namespace = Prompt.ask("Enter namespace", default="grafana-system")
-            pod = Prompt.ask("Enter pod name")
-            try:
-                subprocess.run(["kubectl", "logs", "-n", namespace, pod, "--tail=100"])
-            except Exception as e:
-                console.print(f"Error: {e}", style="red")
-        elif choice == "3":
-            namespace = Prompt.ask("Enter namespace", default="grafana-system")
-            resource_type = Prompt.ask("Enter resource type (pod/deployment/svc)")
-            resource_name = Prompt.ask("Enter resource name")
-            try:
-                subprocess.run(["kubectl", "describe", resource_type, resource_name, "-n", namespace])
-            except Exception as e:
-                console.print(f"Error: {e}", style="red")
+        dispatch[choice]()
+
+
+BACKUP_MENU_TEXT = Text.from_markup("""
+[bold cyan] Database Backup & Restore [/]
+1. Trigger Manual Backup
+2. List All Backups
+3. View Backup Schedule
+4. View Latest Backup Logs
+5. Check Backup System Health
+6. Restore from Backup
+0. Back to Main Menu""")
 
 
 def backup_menu(backup_mgr: BackupManager):
     """Database backup & restore menu"""
+    def trigger_backup():
+        if backup_mgr.trigger_backup():
+            console.print("\n[OK] Backup completed successfully!", style="bold green")
+
+    dispatch = {
+        "1": trigger_backup,
+        "2": backup_mgr.list_backups,
+        "3": backup_mgr.view_schedule,
+        "4": backup_mgr.view_logs,
+        "5": backup_mgr._check_backup_health,
+        "6": backup_mgr.restore_backup,
+    }
+    choices = ["0", *dispatch]
     while True:
-        console.print("\n[bold cyan] Database Backup & Restore [/]")
-        console.print("1. Trigger Manual Backup")
-        console.print("2. List All Backups")
-        console.print("3. View Backup Schedule")
-        console.print("4. View Latest Backup Logs")
-        console.print("5. Check Backup System Health")
-        console.print("6. Restore from Backup")
-        console.print("0. Back to Main Menu")
-        
-        choice = Prompt.ask("Select option", choices=["0", "1", "2", "3", "4", "5", "6"])
-        
+        console.print(BACKUP_MENU_TEXT)
+        choice = Prompt.ask("Select option", choices=choices)
         if choice == "0":
             break
-        elif choice == "1":
-            if backup_mgr.trigger_backup():
-                console.print("\n[OK] Backup completed successfully!", style="bold green")
-        elif choice == "2":
-            backup_mgr.list_backups()
-        elif choice == "3":
-            backup_mgr.view_schedule()
-        elif choice == "4":
-            backup_mgr.view_logs()
-        elif choice == "5":
-            backup_mgr._check_backup_health()
-        elif choice == "6":
-            backup_mgr.restore_backup()
+        dispatch[choice]()
+
+
+HEALTH_MENU_TEXT = Text.from_markup("""
+[bold cyan] System Health Check [/]
+1. Run Full Health Check
+2. Check Cluster Only
+3. Check Grafana Only
+4. Check Database Only
+5. Check Operator Only
+0. Back to Main Menu""")
 
 
 def health_check_menu(health_checker: HealthChecker):
     """System health check menu"""
+    dispatch = {
+        "1": health_checker.check_all,
+        "2": health_checker._check_cluster,
+        "3": health_checker._check_grafana,
+        "4": health_checker._check_database,
+        "5": health_checker._check_operator,
+    }
+    choices = ["0", *dispatch]
     while True:
-        console.print("\n[bold cyan] System Health Check [/]")
-        console.print("1. Run Full Health Check")
-        console.print("2. Check Cluster Only")
-        console.print("3. Check Grafana Only")
-        console.print("4. Check Database Only")
-        console.print("5. Check Operator Only")
-        console.print("0. Back to Main Menu")
-        
-        choice = Prompt.ask("Select option", choices=["0", "1", "2", "3", "4", "5"])
-        
+        console.print(HEALTH_MENU_TEXT)
+        choice = Prompt.ask("Select option", choices=choices)
         if choice == "0":
             break
-        elif choice == "1":
-            health_checker.check_all()
-        elif choice == "2":
-            health_checker._check_cluster()
-        elif choice == "3":
-            health_checker._check_grafana()
-        elif choice == "4":
-            health_checker._check_database()
-        elif choice == "5":
-            health_checker._check_operator()
+        dispatch[choice]()
 
 
 def main():
     """Main application entry point"""
     print_banner()
-    
+
+    # Fill kubectl's discovery cache while the user reads the menu
+    prewarm_discovery_cache()
+
     # Initialize configuration
     cfg = Config()
-    
-    # Initialize managers
-    cluster_mgr = ClusterManager(cfg)
-    operator_mgr = OperatorManager(cfg)
-    grafana_mgr = GrafanaManager(cfg)
-    backup_mgr = BackupManager(cfg)
-    monitoring_mgr = MonitoringManager(cfg)
-    health_checker = HealthChecker(cfg)
-    
+
+    # Managers are built on first use: constructing all six up front builds
+    # API clients and probes kube config before the user has picked anything
+    managers: Dict[type, object] = {}
+
+    def get_mgr(cls):
+        if cls not in managers:
+            managers[cls] = cls(cfg)
+        return managers[cls]
+
     while True:
         main_menu()
         choice = Prompt.ask("Select option", choices=["0", "1", "2", "3", "4", "5", "6", "7"])
-        
+
         if choice == "0":
             console.print("\n Goodbye!", style="bold green")
             break
         elif choice == "1":
-            cluster_menu(cluster_mgr)
+            cluster_menu(get_mgr(ClusterManager))
         elif choice == "2":
-            operator_menu(operator_mgr)
+            operator_menu(get_mgr(OperatorManager))
         elif choice == "3":
-            grafana_menu(grafana_mgr)
+            grafana_menu(get_mgr(GrafanaManager))
         elif choice == "4":
-            backup_menu(backup_mgr)
+            backup_menu(get_mgr(BackupManager))
         elif choice == "5":
-            monitoring_menu(monitoring_mgr)
+            monitoring_menu(get_mgr(MonitoringManager))
         elif choice == "6":
-            health_check_menu(health_checker)
+            health_check_menu(get_mgr(HealthChecker))
         elif choice == "7":
             diagnostics_menu()
 